@@ -0,0 +1,328 @@
+"""
+Headless bulk BOM runner.
+
+    python batch.py bom.csv -o results.jsonl --concurrency 4
+    python batch.py bom.csv --workers 4 --concurrency 2
+
+Reads (manufacturer, MPN) rows from a CSV or JSON file, runs every row through
+the supplier scrapers and appends one JSON line per finished row to the output
+file. Cached offers are only used while fresh (no stale-while-revalidate), so a
+quote never carries an offer older than the supplier's cache TTL.
+
+Progress is checkpointed next to the output, so re-running the same command
+after a crash skips the rows that are already done. Rows where a supplier
+errored or timed out are not checkpointed: the next run tries them again and
+appends a new line, so the last line for a row is the one to use.
+"""
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional, Set
+
+import startup
+from prewarm import prewarm
+from registry import PROVIDERS, LazyBrowser, close_clients, enable_batching, needs_browser, stop_browser
+from search import SupplierOutcome, finish_refreshes, run_concurrent
+
+
+MPN_COLUMNS = ("mpn", "part_number", "part number", "part #", "manufacturer part number")
+MANUFACTURER_COLUMNS = ("manufacturer", "mfr", "brand", "manufacturer name")
+
+
+# ────────────────────────────────
+# Input
+# ────────────────────────────────
+def _pick(row: dict, names) -> str:
+    lowered = {str(k).strip().lower(): v for k, v in row.items() if k is not None}
+    for name in names:
+        value = lowered.get(name)
+        if value:
+            return str(value).strip()
+    return ""
+
+
+def read_rows(path: str) -> List[dict]:
+    """
+    Load BOM rows as [{"manufacturer": ..., "mpn": ...}].
+
+    CSV files need an MPN column (and optionally a manufacturer column).
+    JSON files may hold a list of objects or a list of [manufacturer, mpn] pairs.
+    """
+    rows = []
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for item in data:
+            if isinstance(item, dict):
+                rows.append({"manufacturer": _pick(item, MANUFACTURER_COLUMNS), "mpn": _pick(item, MPN_COLUMNS)})
+            else:
+                manufacturer, mpn = item
+                rows.append({"manufacturer": str(manufacturer or "").strip(), "mpn": str(mpn or "").strip()})
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            for item in csv.DictReader(f):
+                rows.append({"manufacturer": _pick(item, MANUFACTURER_COLUMNS), "mpn": _pick(item, MPN_COLUMNS)})
+
+    return [dict(r, row=i) for i, r in enumerate(rows) if r["mpn"]]
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ────────────────────────────────
+# Checkpoint
+# ────────────────────────────────
+class Checkpoint:
+    """
+    Set of finished row indices, persisted as JSON next to the output file.
+
+    The file is replaced atomically, and complete rows already present in the
+    output file are also treated as done, so a crash between writing a row and
+    saving the checkpoint never re-runs or loses that row.
+    """
+
+    def __init__(self, path: str, input_digest: str, every: int = 10):
+        self.path = path
+        self.input_digest = input_digest
+        self.every = every
+        self.done: Set[int] = set()
+        self._unsaved = 0
+
+    def load(self, output_path: str):
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("input_digest") != self.input_digest:
+                raise SystemExit(
+                    f"Checkpoint {self.path} belongs to a different input file; "
+                    f"use --no-resume to start over."
+                )
+            self.done.update(data.get("done", []))
+
+        if os.path.exists(output_path):
+            with open(output_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        if record_complete(record):
+                            self.done.add(record["row"])
+                    except (ValueError, KeyError, AttributeError):
+                        continue  # partial last line from a crash
+
+    def mark(self, row: int):
+        self.done.add(row)
+        self._unsaved += 1
+        if self._unsaved >= self.every:
+            self.save()
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"input_digest": self.input_digest, "done": sorted(self.done)}, f)
+        os.replace(tmp, self.path)
+        self._unsaved = 0
+
+
+# ────────────────────────────────
+# Runner
+# ────────────────────────────────
+def outcome_record(row: dict, outcomes) -> dict:
+    return {
+        "row": row["row"],
+        "manufacturer": row["manufacturer"],
+        "mpn": row["mpn"],
+        "suppliers": {
+            name: {
+                "results": [r.dict() for r in o.results],
+                "error": str(o.error) if o.error else None,
+                "timed_out": o.timed_out,
+            }
+            for name, o in outcomes.items()
+        },
+    }
+
+
+def record_complete(record: dict) -> bool:
+    """True when no supplier of the row errored or timed out; only those rows are checkpointed."""
+    return all(not s["error"] and not s.get("timed_out") for s in record["suppliers"].values())
+
+
+def write_record(out, record: dict):
+    """Append one row and push it to disk before it is checkpointed."""
+    out.write(json.dumps(record) + "\n")
+    out.flush()
+    os.fsync(out.fileno())
+
+
+def finish_row(out, checkpoint: Checkpoint, row: dict, outcomes):
+    """Write the row's record; checkpoint it only if every supplier answered."""
+    record = outcome_record(row, outcomes)
+    write_record(out, record)
+    if record_complete(record):
+        checkpoint.mark(row["row"])
+        return
+    failed = [name for name, o in outcomes.items() if o.error or o.timed_out]
+    print(f"[Batch] {row['mpn']}: {', '.join(failed)} failed, the row is retried on the next run")
+
+
+async def run_batch(
+    rows: List[dict],
+    suppliers: List[str],
+    output_path: str,
+    checkpoint: Checkpoint,
+    concurrency: int = 4,
+    browser=None,
+    use_cache: bool = True,
+):
+    """Run every row not yet in the checkpoint, `concurrency` rows at a time."""
+    todo = [r for r in rows if r["row"] not in checkpoint.done]
+    print(f"[Batch] {len(rows)} rows, {len(rows) - len(todo)} already done, {len(todo)} to run")
+
+    enable_batching(suppliers)  # e.g. eBay rows in flight share OR searches
+
+    sem = asyncio.Semaphore(max(1, concurrency))
+    started = time.time()
+    finished = 0
+
+    with open(output_path, "a", encoding="utf-8") as out:
+
+        async def _row(row: dict):
+            nonlocal finished
+            async with sem:
+                outcomes = await run_concurrent(
+                    row["mpn"], row["manufacturer"], suppliers, browser,
+                    use_cache=use_cache, stale_while_revalidate=False,
+                )
+
+            finish_row(out, checkpoint, row, outcomes)
+
+            finished += 1
+            rate = finished / max(time.time() - started, 1e-6)
+            print(f"[Batch] {finished}/{len(todo)} done ({row['mpn']}), {rate:.2f} rows/s")
+
+        try:
+            await asyncio.gather(*(_row(r) for r in todo))
+        finally:
+            checkpoint.save()
+
+
+async def run_batch_sharded(
+    rows: List[dict],
+    suppliers: List[str],
+    output_path: str,
+    checkpoint: Checkpoint,
+    workers: int,
+    concurrency: int = 2,
+    use_cache: bool = True,
+):
+    """Like run_batch, but rows are sharded over `workers` processes with their own Chrome."""
+    from workers import run_sharded
+
+    todo = [r for r in rows if r["row"] not in checkpoint.done]
+    by_row = {r["row"]: r for r in todo}
+    print(f"[Batch] {len(rows)} rows, {len(rows) - len(todo)} already done, {len(todo)} to run on {workers} workers")
+
+    pending: Dict[int, Dict[str, SupplierOutcome]] = {}
+    started = time.time()
+    finished = 0
+
+    with open(output_path, "a", encoding="utf-8") as out:
+        try:
+            async for event in run_sharded(
+                todo, suppliers, workers=workers, concurrency=concurrency, use_cache=use_cache
+            ):
+                kind = event[0]
+                if kind == "ready":
+                    print(f"[Batch] Worker {event[1]} ready (pid {event[2]})")
+
+                elif kind == "outcome":
+                    _, _, row, name, results, error, timed_out = event
+                    pending.setdefault(row, {})[name] = SupplierOutcome(
+                        name, results, RuntimeError(error) if error else None, timed_out
+                    )
+
+                elif kind in ("row_done", "row_failed"):
+                    row = by_row[event[2]]
+                    outcomes = pending.pop(row["row"], {})
+                    if kind == "row_failed":
+                        # Suppliers the dead worker never reported count as errors
+                        for name in suppliers:
+                            if name not in outcomes:
+                                outcomes[name] = SupplierOutcome(name, error=RuntimeError(event[3]))
+                        print(f"[Batch] Worker {event[1]} lost {row['mpn']}: {event[3]}")
+                    finish_row(out, checkpoint, row, outcomes)
+
+                    finished += 1
+                    rate = finished / max(time.time() - started, 1e-6)
+                    print(f"[Batch] {finished}/{len(todo)} done ({row['mpn']}), {rate:.2f} rows/s")
+        finally:
+            checkpoint.save()
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run a BOM through the supplier scrapers.")
+    parser.add_argument("input", help="CSV or JSON file with manufacturer / MPN rows")
+    parser.add_argument("-o", "--output", help="JSON lines output file (default: <input>.results.jsonl)")
+    parser.add_argument("--suppliers", nargs="+", default=list(PROVIDERS), choices=list(PROVIDERS))
+    parser.add_argument("--concurrency", type=int, default=4, help="BOM rows in flight at once (per worker)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes, each with its own Chrome")
+    parser.add_argument("--no-cache", action="store_true", help="always scrape, bypassing the offer cache")
+    parser.add_argument("--no-resume", action="store_true", help="ignore and overwrite previous progress")
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    startup.mark("ready")
+    startup.report()
+    output_path = args.output or os.path.splitext(args.input)[0] + ".results.jsonl"
+    checkpoint = Checkpoint(output_path + ".checkpoint.json", file_digest(args.input))
+
+    if args.no_resume:
+        for path in (output_path, checkpoint.path):
+            if os.path.exists(path):
+                os.remove(path)
+    else:
+        checkpoint.load(output_path)
+
+    rows = read_rows(args.input)
+
+    if args.workers > 1:
+        await run_batch_sharded(
+            rows, args.suppliers, output_path, checkpoint, args.workers, args.concurrency, not args.no_cache
+        )
+        print(f"[Batch] Results written to {output_path}")
+        return
+
+    async def _launch():
+        from chrome import get_or_create_browser
+
+        browser, _ = await get_or_create_browser()
+        return browser
+
+    # Chrome starts only when a row needs it (never for API-only or fully cached
+    # runs); prewarm visits the supplier origins only after that
+    browser = LazyBrowser(_launch) if needs_browser(args.suppliers) else None
+
+    try:
+        await prewarm(args.suppliers, browser)
+        await run_batch(rows, args.suppliers, output_path, checkpoint, args.concurrency, browser, not args.no_cache)
+    finally:
+        await finish_refreshes()
+        await close_clients()
+        stop_browser(browser)
+
+    print(f"[Batch] Results written to {output_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,282 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from models import ProviderResult
+
+
+CACHE_PATH = os.getenv(
+    "RSP_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".rsp_procurement", "offers.sqlite3"),
+)
+
+HOUR = 3600
+
+# How long an offer counts as fresh, per supplier (seconds)
+OFFER_TTLS = {
+    "Digi-Key": 6 * HOUR,
+    "Mouser": 6 * HOUR,
+    "RS Online": 6 * HOUR,
+    "Galco": 12 * HOUR,
+    "Radwell": 12 * HOUR,
+    "eBay": 1 * HOUR,  # listings come and go quickly
+}
+DEFAULT_OFFER_TTL = 6 * HOUR
+
+# Past this age an offer is not even served stale
+MAX_STALE_AGE = 7 * 24 * HOUR
+
+
+# Suppliers whose answers depend on the manufacturer searched with (Galco echoes
+# it on direct product pages), so their entries are keyed by MPN and manufacturer
+MANUFACTURER_KEYED = {"Galco"}
+
+
+def normalize_mpn(mpn: str) -> str:
+    """Cache key form of an MPN: no whitespace, upper case."""
+    return re.sub(r"\s+", "", mpn or "").upper()
+
+
+def cache_key(supplier: str, mpn: str, manufacturer: Optional[str] = None) -> str:
+    """The `mpn` column of an entry: the normalized MPN, plus the manufacturer where it matters."""
+    key = normalize_mpn(mpn)
+    if supplier in MANUFACTURER_KEYED:
+        key += "|" + normalize_mpn(manufacturer or "")
+    return key
+
+
+@dataclass
+class CacheEntry:
+    results: List[ProviderResult]
+    fetched_at: float
+    fresh: bool
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+# How long a "not carried" answer is trusted, per supplier (seconds)
+MISS_TTLS = {
+    "eBay": 24 * HOUR,
+}
+DEFAULT_MISS_TTL = 14 * 24 * HOUR
+
+
+def is_miss(results: List[ProviderResult]) -> bool:
+    """
+    True when a scraper answered "this supplier doesn't carry the part".
+
+    Only results flagged `not_carried` count: scrapers set it when the
+    supplier itself says it has no results (e.g. Digi-Key's noResultsText),
+    never on errors, timeouts or pages that did not render. An empty list
+    is a failed scrape, not a miss.
+    """
+    return bool(results) and all(r.not_carried for r in results)
+
+
+# ────────────────────────────────
+# SQLite store
+# ────────────────────────────────
+class _ResultStore:
+    """
+    Table of ProviderResult lists keyed by (supplier, cache_key).
+
+    Backed by SQLite in WAL mode so the GUI, batch runs and worker processes
+    can share one file.
+    """
+
+    table = ""
+
+    def __init__(self, path: str, ttls: dict, default_ttl: float):
+        self.path = path
+        self.ttls = ttls
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.table} (
+                supplier   TEXT NOT NULL,
+                mpn        TEXT NOT NULL,
+                payload    TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (supplier, mpn)
+            )
+            """
+        )
+        self._db.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def ttl(self, supplier: str) -> float:
+        return self.ttls.get(supplier, self.default_ttl)
+
+    def _load(self, supplier: str, mpn: str, manufacturer: Optional[str] = None):
+        with self._lock:
+            return self._db.execute(
+                f"SELECT payload, fetched_at FROM {self.table} WHERE supplier = ? AND mpn = ?",
+                (supplier, cache_key(supplier, mpn, manufacturer)),
+            ).fetchone()
+
+    def put(self, supplier: str, mpn: str, results: List[ProviderResult], manufacturer: Optional[str] = None):
+        payload = json.dumps([r.dict() for r in results])
+        with self._lock:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO {self.table} (supplier, mpn, payload, fetched_at) VALUES (?, ?, ?, ?)",
+                (supplier, cache_key(supplier, mpn, manufacturer), payload, time.time()),
+            )
+            self._db.commit()
+
+    def invalidate(
+        self, supplier: Optional[str] = None, mpn: Optional[str] = None, manufacturer: Optional[str] = None
+    ) -> int:
+        """
+        Drop entries matching the given supplier and/or MPN (all entries if neither).
+
+        For MANUFACTURER_KEYED suppliers `manufacturer` narrows it to that
+        manufacturer's entry; without it every manufacturer's entry goes.
+        """
+        where, args = [], []
+        if supplier:
+            where.append("supplier = ?")
+            args.append(supplier)
+        if mpn and supplier and manufacturer is not None:
+            where.append("mpn = ?")
+            args.append(cache_key(supplier, mpn, manufacturer))
+        elif mpn:
+            key = normalize_mpn(mpn)
+            where.append("(mpn = ? OR substr(mpn, 1, ?) = ?)")
+            args.extend([key, len(key) + 1, key + "|"])
+        sql = f"DELETE FROM {self.table}" + (" WHERE " + " AND ".join(where) if where else "")
+        with self._lock:
+            count = self._db.execute(sql, args).rowcount
+            self._db.commit()
+        return count
+
+    def stats(self) -> dict:
+        with self._lock:
+            (entries,) = self._db.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        return {"entries": entries, "hits": self.hits, "misses": self.misses}
+
+
+# ────────────────────────────────
+# Offer cache
+# ────────────────────────────────
+class OfferCache(_ResultStore):
+    """
+    Cache of real supplier offers.
+
+    Entries younger than the supplier TTL are fresh; older ones (up to
+    MAX_STALE_AGE) are returned with `fresh=False` so the caller can serve
+    them while it refreshes in the background.
+    """
+
+    table = "offers"
+
+    def __init__(self, path: str = CACHE_PATH, ttls: Optional[dict] = None):
+        super().__init__(path, dict(OFFER_TTLS, **(ttls or {})), DEFAULT_OFFER_TTL)
+        self.stale_hits = 0
+
+    def get(self, supplier: str, mpn: str, manufacturer: Optional[str] = None) -> Optional[CacheEntry]:
+        row = self._load(supplier, mpn, manufacturer)
+        if row is None:
+            self.misses += 1
+            return None
+
+        payload, fetched_at = row
+        age = time.time() - fetched_at
+        if age > MAX_STALE_AGE:
+            self.misses += 1
+            return None
+
+        fresh = age <= self.ttl(supplier)
+        if fresh:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        results = [ProviderResult(**d) for d in json.loads(payload)]
+        return CacheEntry(results, fetched_at, fresh)
+
+    def stats(self) -> dict:
+        return dict(super().stats(), stale_hits=self.stale_hits)
+
+
+# ────────────────────────────────
+# Negative cache
+# ────────────────────────────────
+class MissCache(_ResultStore):
+    """
+    Cache of "not carried" answers (see is_miss), kept apart from real offers.
+
+    Misses rarely change, so they live much longer than offers, but they are
+    never served past their TTL. Use `invalidate` (or `python cache.py
+    clear-misses`) when a supplier starts stocking a part.
+    """
+
+    table = "misses"
+
+    def __init__(self, path: str = CACHE_PATH, ttls: Optional[dict] = None):
+        super().__init__(path, dict(MISS_TTLS, **(ttls or {})), DEFAULT_MISS_TTL)
+
+    def get(self, supplier: str, mpn: str, manufacturer: Optional[str] = None) -> Optional[CacheEntry]:
+        row = self._load(supplier, mpn, manufacturer)
+        if row is None or time.time() - row[1] > self.ttl(supplier):
+            self.misses += 1
+            return None
+
+        payload, fetched_at = row
+        results = [ProviderResult(**d) for d in json.loads(payload)]
+        if not is_miss(results):  # stored before misses had to be explicit
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CacheEntry(results, fetched_at, True)
+
+
+_CACHE: Optional[OfferCache] = None
+_MISS_CACHE: Optional[MissCache] = None
+
+
+def get_offer_cache() -> OfferCache:
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = OfferCache()
+    return _CACHE
+
+
+def get_miss_cache() -> MissCache:
+    global _MISS_CACHE
+    if _MISS_CACHE is None:
+        _MISS_CACHE = MissCache()
+    return _MISS_CACHE
+
+
+# ────────────────────────────────
+# Manual maintenance
+# ────────────────────────────────
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the offer and miss caches.")
+    parser.add_argument("action", choices=["stats", "clear-misses", "clear-offers"])
+    parser.add_argument("--supplier", help="only entries for this supplier (e.g. Galco)")
+    parser.add_argument("--mpn", help="only entries for this MPN")
+    args = parser.parse_args()
+
+    if args.action == "stats":
+        print("offers:", get_offer_cache().stats())
+        print("misses:", get_miss_cache().stats())
+    elif args.action == "clear-misses":
+        print(f"Removed {get_miss_cache().invalidate(args.supplier, args.mpn)} miss entries")
+    else:
+        print(f"Removed {get_offer_cache().invalidate(args.supplier, args.mpn)} offer entries")
@@ -0,0 +1,58 @@
+import functools
+import os
+import platform
+import shutil
+from typing import Optional
+
+
+PROFILE_DIR = "/tmp/chrome_profile"
+
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-software-rasterizer",
+    "--disable-blink-features=AutomationControlled",
+]
+
+
+@functools.lru_cache(maxsize=1)
+def get_chrome_path() -> Optional[str]:
+    """Chrome's executable for this OS; looked up once per process."""
+    system = platform.system()
+    if system == "Darwin":  # macOS
+        return "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+    elif system == "Windows":
+        possible_paths = [
+            os.path.join(os.environ.get("PROGRAMFILES(X86)", ""), "Google\\Chrome\\Application\\chrome.exe"),
+            os.path.join(os.environ.get("PROGRAMFILES", ""), "Google\\Chrome\\Application\\chrome.exe"),
+            os.path.join(os.environ.get("LOCALAPPDATA", ""), "Google\\Chrome\\Application\\chrome.exe"),
+        ]
+        for path in possible_paths:
+            if os.path.exists(path):
+                return path
+        # fallback to PATH
+        return shutil.which("chrome.exe")
+    else:  # Linux
+        return shutil.which("google-chrome") or shutil.which("chromium-browser")
+
+
+async def start_browser(user_data_dir: str = PROFILE_DIR):
+    """Launch Chrome through nodriver (imported here, so it only loads when Chrome does)."""
+    import nodriver as uc
+
+    return await uc.start(
+        headless=False,
+        no_sandbox=True,
+        executable_path=get_chrome_path(),
+        user_data_dir=user_data_dir,
+        browser_args=BROWSER_ARGS,
+    )
+
+
+async def get_or_create_browser(browser=None, user_data_dir: str = PROFILE_DIR):
+    """Return an existing browser or create a new one."""
+    if browser:
+        return browser, False  # existing browser, not owned
+    return await start_browser(user_data_dir), True  # newly created browser
@@ -0,0 +1,73 @@
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+
+# Overall budget of one search / BOM line, in seconds (0 disables)
+SEARCH_BUDGET = float(os.getenv("RSP_SEARCH_BUDGET", "45"))
+
+# Monotonic time the current search must be answered by, or None for no limit.
+# asyncio tasks copy the context they are created in, so every supplier task
+# (and the tabs, hedges and HTTP calls under it) sees its search's deadline.
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("rsp_deadline", default=None)
+
+
+# ────────────────────────────────
+# Setting the deadline
+# ────────────────────────────────
+@contextmanager
+def deadline(seconds: Optional[float]):
+    """
+    `with deadline(45):` — everything started inside must finish within 45 s.
+
+    A nested deadline can only tighten the outer one. `seconds=None` (or 0)
+    leaves the current deadline as it is.
+    """
+    if not seconds or seconds <= 0:
+        yield _DEADLINE.get()
+        return
+    at = time.monotonic() + seconds
+    outer = _DEADLINE.get()
+    if outer is not None:
+        at = min(at, outer)
+    token = _DEADLINE.set(at)
+    try:
+        yield at
+    finally:
+        _DEADLINE.reset(token)
+
+
+def clear_deadline():
+    """Detach the current task from its search's deadline (e.g. a background refresh)."""
+    _DEADLINE.set(None)
+
+
+# ────────────────────────────────
+# Reading it
+# ────────────────────────────────
+def remaining() -> Optional[float]:
+    """Seconds left before the deadline (never negative), or None without one."""
+    at = _DEADLINE.get()
+    if at is None:
+        return None
+    return max(0.0, at - time.monotonic())
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def clamp(timeout: float) -> float:
+    """`timeout`, shortened so a wait never outlives the deadline."""
+    left = remaining()
+    return timeout if left is None else min(timeout, left)
+
+
+def http_timeout(total: float):
+    """Per-request aiohttp timeout of at most `total` seconds, clamped to the deadline."""
+    import aiohttp  # only HTTP callers need it, and they have loaded it already
+
+    return aiohttp.ClientTimeout(total=max(0.1, clamp(total)))
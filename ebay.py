@@ -2,54 +2,141 @@
 # eBay API Scraper (FULL ASYNC, FINAL VERSION)
 # ────────────────────────────────
 
+import asyncio
 import aiohttp
 import base64
 import re
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional
+from deadline import http_timeout
+from http_clients import discard_session
+from matching import matcher_for
 from models import ProviderResult
+from rate_limit import BLOCK_STATUSES, rate_limited, report_blocked
 
 EBAY_CLIENT_ID = "YOUR_NEW_CLIENT_ID"
 EBAY_CLIENT_SECRET = "YOUR_NEW_CLIENT_SECRET"
 
-# Cache the token to avoid requesting a new one on every call
-_cached_token: Optional[str] = None
-_cached_token_expire: float = 0
+SEARCH_URL = "https://api.ebay.com/buy/browse/v1/item_summary/search"
+TOKEN_URL = "https://api.ebay.com/identity/v1/oauth2/token"
+
+# Refresh the OAuth token this long before eBay says it expires
+TOKEN_REFRESH_MARGIN = 300
 
 
 # ------------------------------------------------------
-# Generate or reuse OAuth token
+# Shared client
 # ------------------------------------------------------
-async def ebay_get_access_token():
-    global _cached_token, _cached_token_expire
+class EbayClient:
+    """
+    Long-lived Browse API client shared by every eBay lookup.
+
+    One pooled connector (keep-alive, cached DNS) carries both the OAuth and
+    the search calls. The application token is fetched once under a lock and
+    renewed TOKEN_REFRESH_MARGIN seconds before it expires, so a burst of
+    lookups never races to refresh it.
+    """
+
+    def __init__(self, client_id: str, client_secret: str, refresh_margin: float = TOKEN_REFRESH_MARGIN):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_margin = refresh_margin
+        self._token: Optional[str] = None
+        self._token_expire = 0.0
+        self._token_lock = asyncio.Lock()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.token_refreshes = 0
+
+    def _http(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=600, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+        return self._session
+
+    def _token_valid(self) -> bool:
+        return bool(self._token) and time.time() < self._token_expire - self.refresh_margin
+
+    async def token(self) -> str:
+        if self._token_valid():
+            return self._token
+
+        async with self._token_lock:
+            if self._token_valid():  # someone else refreshed while we waited
+                return self._token
+
+            creds = f"{self.client_id}:{self.client_secret}"
+            encoded = base64.b64encode(creds.encode()).decode()
+            headers = {
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Authorization": f"Basic {encoded}",
+            }
+            data = {
+                "grant_type": "client_credentials",
+                "scope": "https://api.ebay.com/oauth/api_scope",
+            }
+            async with self._http().post(TOKEN_URL, headers=headers, data=data, timeout=http_timeout(15)) as resp:
+                resp.raise_for_status()
+                payload = await resp.json()
 
-    # Reuse token if not expired
-    if _cached_token and time.time() < _cached_token_expire:
-        return _cached_token
+            # Token caching (expires in ~7200 seconds)
+            self._token = payload["access_token"]
+            self._token_expire = time.time() + payload.get("expires_in", 3600)
+            self.token_refreshes += 1
+            return self._token
+
+    async def search(self, params: dict) -> dict:
+        """GET item_summary/search; a 401 (token revoked early) refreshes the token once."""
+        for attempt in (1, 2):
+            token = await self.token()
+            headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+            async with self._http().get(
+                SEARCH_URL, headers=headers, params=params, timeout=http_timeout(15)
+            ) as resp:
+                if resp.status == 401 and attempt == 1:
+                    self._token = None
+                    continue
+                resp.raise_for_status()
+                return await resp.json()
 
-    creds = f"{EBAY_CLIENT_ID}:{EBAY_CLIENT_SECRET}"
-    encoded = base64.b64encode(creds.encode()).decode()
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
-    url = "https://api.ebay.com/identity/v1/oauth2/token"
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded",
-        "Authorization": f"Basic {encoded}",
-    }
-    data = {
-        "grant_type": "client_credentials",
-        "scope": "https://api.ebay.com/oauth/api_scope",
-    }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, data=data) as resp:
-            resp.raise_for_status()
-            payload = await resp.json()
+_CLIENTS: Dict[tuple, EbayClient] = {}
+_CLIENTS_LOOP = None
+
+
+def get_ebay_client(client_id: str = EBAY_CLIENT_ID, client_secret: str = EBAY_CLIENT_SECRET) -> EbayClient:
+    """One client per credential pair (and event loop)."""
+    global _CLIENTS_LOOP
+    loop = asyncio.get_running_loop()
+    if _CLIENTS_LOOP is not loop:
+        for client in _CLIENTS.values():
+            discard_session(client._session, _CLIENTS_LOOP)
+        _CLIENTS.clear()
+        _CLIENTS_LOOP = loop
+
+    key = (client_id, client_secret)
+    if key not in _CLIENTS:
+        _CLIENTS[key] = EbayClient(client_id, client_secret)
+    return _CLIENTS[key]
+
+
+async def close_ebay_clients():
+    for client in list(_CLIENTS.values()):
+        await client.close()
+    _CLIENTS.clear()
 
-            # Token caching (expires in ~7200 seconds)
-            _cached_token = payload["access_token"]
-            _cached_token_expire = time.time() + payload.get("expires_in", 3600)
 
-            return _cached_token
+# ------------------------------------------------------
+# Generate or reuse OAuth token
+# ------------------------------------------------------
+async def ebay_get_access_token():
+    return await get_ebay_client().token()
 
 
 # ------------------------------------------------------
@@ -63,23 +150,12 @@ def extract_sku_tokens(title: str):
 # ------------------------------------------------------
 # FULL ASYNC eBay Scraper
 # ------------------------------------------------------
+@rate_limited("eBay")
 async def scrape_ebay(mpn: str) -> List[ProviderResult]:
     print(f"🔍 Searching eBay for: {mpn}")
 
     results: List[ProviderResult] = []
 
-    try:
-        token = await ebay_get_access_token()
-    except Exception as e:
-        print("❌ eBay OAuth error:", e)
-        return results
-
-    url = "https://api.ebay.com/buy/browse/v1/item_summary/search"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
     params = {
         "q": f'"{mpn}"',  # exact quoted match
         "limit": "50",
@@ -87,11 +163,12 @@ async def scrape_ebay(mpn: str) -> List[ProviderResult]:
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
-
+        data = await get_ebay_client().search(params)
+    except aiohttp.ClientResponseError as e:
+        print("❌ eBay API error:", e)
+        if e.status in BLOCK_STATUSES:
+            report_blocked(f"HTTP {e.status}")
+        return results
     except Exception as e:
         print("❌ eBay API error:", e)
         return results
@@ -99,7 +176,7 @@ async def scrape_ebay(mpn: str) -> List[ProviderResult]:
     items = data.get("itemSummaries", [])
     print(f"📦 eBay returned {len(items)} raw listings")
 
-    sku_upper = mpn.upper()
+    matcher = matcher_for(mpn)
 
     for item in items:
         title = item.get("title", "")
@@ -112,10 +189,7 @@ async def scrape_ebay(mpn: str) -> List[ProviderResult]:
         tokens = extract_sku_tokens(title_upper)
 
         # Detect exact match
-        exact_match = any(t == sku_upper for t in tokens)
-
-        # Alternative SKU candidates
-        alt_candidates = [t for t in tokens if t != sku_upper]
+        exact_match = bool(matcher.exact_tokens(tokens))
 
         # Must have photos
         if not item.get("image", {}).get("imageUrl"):
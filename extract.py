@@ -0,0 +1,133 @@
+import json
+from typing import Optional
+
+
+# ────────────────────────────────
+# Extraction specs
+# ────────────────────────────────
+# Each spec names the nodes a supplier's product-page parser reads, so they can
+# be read inside the browser and only a small JSON object crosses CDP.
+#
+#   "page":   {field: (selector, mode)}  read once from the document
+#   "blocks": selector                   repeated containers (e.g. price blocks)
+#   "block":  {field: (selector, mode)}  read inside every block
+#
+# Modes mirror the BeautifulSoup calls in providers.py:
+#   "text"            el.text                        (None when missing)
+#   "strip"           el.get_text(strip=True)
+#   "all_text"        [el.text for el in select(...)]
+#   "all_text_in:<t>" the same, within the first <t> only ([] when missing)
+#   "count"           len(select(...))
+#   "string_has:<s>"  first el whose .string contains <s>, as text
+SPECS = {
+    "Digi-Key": {
+        "page": {
+            "manufacturer": ("tr[data-testid='overview-manufacturer']", "text"),
+            "scraped_sku": ("td[data-testid='mfr-number']", "text"),
+        },
+        "blocks": "div[data-evg='price-procurement-wrapper']",
+        "block": {
+            "stock": ("span", "string_has:In-Stock"),
+            "prices": ("td.MuiTableCell-body:nth-of-type(2)", "all_text_in:table.MuiTable-root"),
+        },
+    },
+    "Mouser": {
+        "page": {
+            "restricted": ("[data-testid='RestrictedAvailabilityTrigger']", "text"),
+            "manufacturer": ("a#lnkManufacturerName", "strip"),
+            "scraped_sku": ("span#spnManufacturerPartNumber", "strip"),
+            "stock": ("h2[data-testid='PricingAvailabilityHeader']", "text"),
+            "price": ("tr[data-testid='PricingTablePriceBreakRow'] td", "text"),
+        },
+    },
+    "Galco": {
+        "page": {
+            "scraped_sku": ("div[itemprop='MFG Item Number']", "text"),
+            "stock": ("span.stock-number", "text"),
+            "price": ("span.price", "text"),
+        },
+    },
+    "Radwell": {
+        "page": {
+            "options": ("div.option", "count"),
+            "scraped_sku": ("span.pdp-part-number", "text"),
+            "manufacturer": ("div.manufacturer-container", "strip"),
+        },
+        "blocks": "div.option[data-id='FNFP']",
+        "block": {
+            "stock": ("div.option__stock__v2", "strip"),
+            "price": ("span.ActualPrice", "text"),
+        },
+    },
+}
+
+
+_EXTRACT_JS = """
+(() => {
+    const spec = %(spec)s;
+    const strip = (el) => {
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        let out = "";
+        while (walker.nextNode()) out += walker.currentNode.nodeValue.trim();
+        return out;
+    };
+    const read = (root, selector, mode) => {
+        if (mode === "all_text") {
+            return Array.from(root.querySelectorAll(selector)).map((el) => el.textContent);
+        }
+        if (mode.startsWith("all_text_in:")) {
+            const within = root.querySelector(mode.slice("all_text_in:".length));
+            return within ? read(within, selector, "all_text") : [];
+        }
+        if (mode === "count") return root.querySelectorAll(selector).length;
+        if (mode.startsWith("string_has:")) {
+            const needle = mode.slice("string_has:".length);
+            for (const el of root.querySelectorAll(selector)) {
+                if (el.children.length === 0 && el.textContent.includes(needle)) return el.textContent;
+            }
+            return null;
+        }
+        const el = root.querySelector(selector);
+        if (!el) return null;
+        return mode === "strip" ? strip(el) : el.textContent;
+    };
+    const readFields = (root, fields) => {
+        const out = {};
+        for (const [name, [selector, mode]] of Object.entries(fields || {})) {
+            out[name] = read(root, selector, mode);
+        }
+        return out;
+    };
+    return {
+        ok: true,
+        page: readFields(document, spec.page),
+        blocks: spec.blocks
+            ? Array.from(document.querySelectorAll(spec.blocks)).map((b) => readFields(b, spec.block))
+            : [],
+    };
+})()
+"""
+
+
+async def extract_fields(page, supplier: str) -> Optional[dict]:
+    """
+    Run the supplier's extraction spec inside the page.
+
+    Returns {"page": {...}, "blocks": [{...}, ...]}, or None when the supplier
+    has no spec or the evaluation failed, in which case the caller falls back
+    to parsing the full HTML.
+    """
+    spec = SPECS.get(supplier)
+    if spec is None:
+        return None
+
+    try:
+        result = await page.evaluate(_EXTRACT_JS % {"spec": json.dumps(spec)}, return_by_value=True)
+    except Exception as e:
+        print(f"[Extract] {supplier} in-page extraction failed: {e}")
+        return None
+
+    if not isinstance(result, dict) or not result.get("ok"):
+        print(f"[Extract] {supplier} in-page extraction returned nothing usable")
+        return None
+    return result
@@ -1,226 +1,105 @@
+import startup
 import flet as ft
 import asyncio
+from chrome import start_browser
 from models import ProviderResult
-from providers import (
-    scrape_digikey,
-    scrape_mouser,
-    scrape_rs,
-    scrape_galco,
-    scrape_ebay,
-    scrape_radwell,
-)
+from registry import PROVIDERS, LazyBrowser
+from search import lookup_supplier, search_stream
+from prewarm import prewarm
+from results_view import ResultsView
 
-import nodriver as uc
-import os
-import platform
-import shutil
+startup.mark("imports")
+
+# Suppliers left unticked when the app opens
+UNCHECKED_BY_DEFAULT = {"Mouser"}
 
 
 # ======================================================
-#   GLOBAL BROWSER INSTANCE
+#   SHARED BROWSER, LAUNCHED ON DEMAND
 # ======================================================
-GLOBAL_BROWSER = None
-
-
-def get_chrome_path():
-    system = platform.system()
-    if system == "Darwin":
-        return "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-    elif system == "Windows":
-        possible_paths = [
-            os.path.join(os.environ.get("PROGRAMFILES(X86)", ""), "Google\\Chrome\\Application\\chrome.exe"),
-            os.path.join(os.environ.get("PROGRAMFILES", ""), "Google\\Chrome\\Application\\chrome.exe"),
-            os.path.join(os.environ.get("LOCALAPPDATA", ""), "Google\\Chrome\\Application\\chrome.exe"),
-        ]
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        return shutil.which("chrome.exe")
-    else:
-        return shutil.which("google-chrome") or shutil.which("chromium-browser")
-
-
-chrome_path = get_chrome_path()
+# Launched by the first search that needs Chrome (or by the RS warm-up when
+# there is no usable saved session); eBay-only and cache-served searches never
+# start it, and the supplier origins are only warmed once it runs
+GLOBAL_BROWSER = LazyBrowser(start_browser)
 
 
 # ======================================================
-#   ALWAYS RETURN SAME BROWSER INSTANCE
+#   RESCRAPE ONE ROW
 # ======================================================
-async def get_or_create_browser():
-    global GLOBAL_BROWSER
-
-    if GLOBAL_BROWSER:
-        return GLOBAL_BROWSER
-
-    GLOBAL_BROWSER = await uc.start(
-        headless=False,
-        no_sandbox=True,
-        executable_path=chrome_path,
-        user_data_dir="/tmp/chrome_profile",
-        browser_args=[
-            "--no-sandbox",
-            "--disable-setuid-sandbox",
-            "--disable-dev-shm-usage",
-            "--disable-gpu",
-            "--disable-software-rasterizer",
-            "--disable-blink-features=AutomationControlled",
-        ],
-    )
+def placeholder_row(name, manufacturer, mpn, text):
+    return {
+        "supplier": name,
+        "part_number": "",
+        "manufacturer": manufacturer,
+        "stock": text,
+        "price": text,
+        "url": "",
+        "exact_match": False,
+        "scraped_sku": "",
+        "__provider": name,
+        "__mpn": mpn,
+        "__manufacturer": manufacturer,
+    }
 
-    return GLOBAL_BROWSER
 
+async def rescrape_row(r):
+    mpn, manufacturer = r["__mpn"], r["__manufacturer"]
+    # Rescrape always goes to the supplier and refreshes the cache entry
+    new_res = await lookup_supplier(r["__provider"], mpn, manufacturer, GLOBAL_BROWSER, refresh=True)
 
-# ======================================================
-#   INSERT ROW FUNCTION WITH RESCRAPE
-# ======================================================
-def insert_row_fn(table, result_list, header, manufacturer, mpn, page):
-    if result_list:
-        table.rows.append(
-            ft.DataRow(
-                cells=[ft.DataCell(ft.Text(header, weight="bold"))]
-                + [ft.DataCell(ft.Text(""))] * 8
-            )
-        )
-
-    for r in result_list:
-
-        def make_rescrape_button(r):
-            async def perform_rescrape(e):
-                provider_map = {
-                    "Digi-Key": scrape_digikey,
-                    "Mouser": scrape_mouser,
-                    "RS Online": scrape_rs,
-                    "Galco": scrape_galco,
-                    "eBay": scrape_ebay,
-                    "Radwell": scrape_radwell,
-                }
-
-                browser = await get_or_create_browser()
-                scraper = provider_map[r["__provider"]]
-
-                if r["__provider"] == "Galco":
-                    new_res = await scraper(mpn, manufacturer, browser=browser)
-                else:
-                    new_res = await scraper(mpn, browser=browser)
-
-                if new_res:
-                    new_res = (
-                        new_res[0].dict()
-                        if isinstance(new_res[0], ProviderResult)
-                        else new_res[0]
-                    )
-                # Else placholder provider result
-                else:
-                    new_res = {
-                        "supplier": r.get("supplier", ""),
-                        "part_number": r.get("part_number", ""),
-                        "manufacturer": r.get("manufacturer", ""),
-                        "stock": "N/A - Try Rescraping",
-                        "price": "N/A - Try Rescraping",
-                        "url": "",
-                        "exact_match": False,
-                        "scraped_sku": "",
-                    }
-                    # Find the DataRow that contains the button
-                row = e.control
-                while not isinstance(row, ft.DataRow):
-                    row = row.parent
-
-                # Update the cells in that row
-                row.cells[2].content.value = new_res.get("manufacturer", manufacturer)
-                row.cells[3].content.value = str(new_res.get("stock", ""))
-                row.cells[4].content.value = str(new_res.get("price", ""))
-                row.cells[5].content.url = new_res.get("url", "")
-                row.cells[6].content.value = "Yes" if new_res.get("exact_match") else "No"
-                row.cells[7].content.value = new_res.get("scraped_sku", "")
-                page.update()
-
-            return ft.ElevatedButton("🔄 Rescrape", on_click=perform_rescrape)
-
-
-        table.rows.append(
-            ft.DataRow(
-                cells=[
-                    ft.DataCell(ft.Text(r.get("supplier", ""))),
-                    ft.DataCell(ft.Text(r.get("part_number", ""))),
-                    ft.DataCell(ft.Text(r.get("manufacturer", manufacturer))),
-                    ft.DataCell(ft.Text(str(r.get("stock", "")))),
-                    ft.DataCell(ft.Text(str(r.get("price", "")))),
-                    ft.DataCell(ft.TextButton("Open", url=r.get("url", ""))),
-                    ft.DataCell(ft.Text("Yes" if r.get("exact_match") else "No")),
-                    ft.DataCell(ft.Text(r.get("scraped_sku", ""))),
-                    ft.DataCell(make_rescrape_button(r)),
-                ]
-            )
-        )
+    if not new_res:
+        row = placeholder_row(r.get("supplier", ""), r.get("manufacturer", ""), mpn, "N/A - Try Rescraping")
+        row["part_number"] = r.get("part_number", "")
+        row["__provider"] = r["__provider"]
+        return row
+
+    row = new_res[0].dict() if isinstance(new_res[0], ProviderResult) else dict(new_res[0])
+    row.setdefault("manufacturer", manufacturer)
+    row.update(__provider=r["__provider"], __mpn=mpn, __manufacturer=manufacturer)
+    return row
 
 
 # ======================================================
-#   RUN SCRAPERS USING ONE SHARED BROWSER
+#   RUN SCRAPERS CONCURRENTLY ON ONE SHARED BROWSER
 # ======================================================
-async def run_scrapers(mpn, manufacturer, page, table, status_text, enabled_providers):
+async def run_scrapers(mpn, manufacturer, page, results_view, status_text, enabled_providers):
     status_text.value = f"🔍 Searching for '{mpn}' by '{manufacturer}'..."
     page.update()
 
-    table.rows.clear()
-    all_results = []
-
-    # Get shared browser
-    browser = await get_or_create_browser()
-
-    scrapers = {
-        "Digi-Key": (scrape_digikey, False),
-        "Mouser": (scrape_mouser, False),
-        "RS Online": (scrape_rs, False),
-        "Galco": (scrape_galco, True),
-        "eBay": (scrape_ebay, False),
-        "Radwell": (scrape_radwell, False),
-    }
-
-    for name in enabled_providers:
-        scraper, needs_brand = scrapers[name]
-
-        status_text.value = f"➡️ Scraping {name}..."
-        page.update()
-
-        try:
-            if needs_brand:
-                results = await scraper(mpn, manufacturer, browser=browser)
-            else:
-                results = await scraper(mpn, browser=browser)
-                print(f"[INFO] Scraped {results} results from {name} for {mpn}")
-
-            if results:
-                for r in results:
-                    d = r.dict() if isinstance(r, ProviderResult) else r
-                    d["__provider"] = name
-                    all_results.append(d)
-            else:
-                # placeholder provider result
-                all_results.append(
-                    {
-                        "supplier": name,
-                        "part_number": "",
-                        "manufacturer": manufacturer,
-                        "stock": "N/A - Try Scraping Again",
-                        "price": "N/A - Try Scraping Again",
-                        "url": "",
-                        "exact_match": False,
-                        "scraped_sku": "",
-                        "__provider": name,
-                    }
-                )
-
-        except Exception as e:
-            status_text.value = f"❌ Error scraping {name}: {e}"
-            page.update()
-
-    # Organize results
-    exact = [r for r in all_results]
-    # non_exact = [r for r in all_results if not r.get("exact_match")]
-
-    insert_row_fn(table, exact, "EXACT MATCHES", manufacturer, mpn, page)
-    # insert_row_fn(table, non_exact, "ALTERNATIVES / NOT EXACT", manufacturer, mpn, page)
+    results_view.clear()
+
+    pending = set(enabled_providers)
+
+    # Every supplier runs at the same time on its own tab; rows appear as each one answers
+    async for outcome in search_stream(mpn, manufacturer, enabled_providers, GLOBAL_BROWSER, outcomes=True):
+        name = outcome.name
+        pending.discard(name)
+        if outcome.ok:
+            status_text.value = f"➡️ {name} done, waiting on: {', '.join(sorted(pending)) or '-'}"
+        elif outcome.timed_out:
+            status_text.value = f"⏱️ {name} timed out, waiting on: {', '.join(sorted(pending)) or '-'}"
+        else:
+            status_text.value = f"❌ Error scraping {name}: {outcome.error}"
+            status_text.update()
+            continue
+        status_text.update()
+
+        results = outcome.results
+        print(f"[INFO] Scraped {results} results from {name} for {mpn}")
+
+        rows = []
+        if results:
+            for r in results:
+                d = r.dict() if isinstance(r, ProviderResult) else r
+                d.update(__provider=name, __mpn=mpn, __manufacturer=manufacturer)
+                rows.append(d)
+        else:
+            # placeholder provider result
+            placeholder = "Timed out - Try Rescraping" if outcome.timed_out else "N/A - Try Scraping Again"
+            rows.append(placeholder_row(name, manufacturer, mpn, placeholder))
+
+        # Batched: the table sends one update per flush, not one per supplier
+        results_view.add(rows)
 
     status_text.value = "✅ Done!"
     page.update()
@@ -240,36 +119,12 @@ def main(page: ft.Page):
     mpn_input = ft.TextField(label="Part Number (MPN)", width=250)
     status_text = ft.Text("Ready", color=ft.Colors.GREY)
 
-    results_table = ft.DataTable(
-        columns=[
-            ft.DataColumn(ft.Text("Supplier")),
-            ft.DataColumn(ft.Text("Part #")),
-            ft.DataColumn(ft.Text("Manufacturer")),
-            ft.DataColumn(ft.Text("Stock")),
-            ft.DataColumn(ft.Text("Price")),
-            ft.DataColumn(ft.Text("URL")),
-            ft.DataColumn(ft.Text("Exact Match")),
-            ft.DataColumn(ft.Text("Scraped SKU")),
-            ft.DataColumn(ft.Text("Action")),
-        ],
-        rows=[]
-    )
-
-    scrollable_results = ft.ListView(
-        controls=[results_table],
-        spacing=10,
-        expand=True,
-        auto_scroll=False,
-    )
+    # Paged table: only the visible rows are widgets, sort/filter live in its store
+    results_view = ResultsView(on_rescrape=rescrape_row)
 
     select_all = ft.Checkbox(label="Select All", value=True)
     provider_checks = {
-        "Digi-Key": ft.Checkbox(label="Digi-Key", value=True),
-        "Mouser": ft.Checkbox(label="Mouser", value=False),
-        "RS Online": ft.Checkbox(label="RS Online", value=True),
-        "Galco": ft.Checkbox(label="Galco", value=True),
-        "eBay": ft.Checkbox(label="eBay", value=True),
-        "Radwell": ft.Checkbox(label="Radwell", value=True),
+        name: ft.Checkbox(label=name, value=name not in UNCHECKED_BY_DEFAULT) for name in PROVIDERS
     }
 
     def toggle_all(e):
@@ -289,7 +144,7 @@ def main(page: ft.Page):
             return
 
         enabled = [name for name, cb in provider_checks.items() if cb.value]
-        await run_scrapers(mpn, manu, page, results_table, status_text, enabled)
+        await run_scrapers(mpn, manu, page, results_view, status_text, enabled)
 
     search_btn = ft.ElevatedButton("Search", on_click=handle_search)
 
@@ -298,8 +153,37 @@ def main(page: ft.Page):
         ft.Row([select_all] + list(provider_checks.values())),
         search_btn,
         status_text,
-        ft.Container(content=scrollable_results, expand=True),
+        ft.Container(content=results_view, expand=True),
     )
+    startup.mark("window")
+    startup.report()
+
+    async def warm_up():
+        # Token, sessions and clients now, not on the first Search click; the
+        # supplier pages are visited as soon as a search has started Chrome
+        enabled = [name for name, cb in provider_checks.items() if cb.value]
+        warming = set(enabled)
+
+        def on_progress(name, state, seconds):
+            if state == "warming":
+                return
+            warming.discard(name)
+            if not status_text.value.startswith("🔥"):
+                return  # a search has taken over the status line
+            if warming:
+                status_text.value = f"🔥 Warming up: {', '.join(sorted(warming))}"
+            else:
+                status_text.value = "Ready"
+            page.update()
+
+        status_text.value = f"🔥 Warming up: {', '.join(sorted(warming))}"
+        page.update()
+        await prewarm(enabled, GLOBAL_BROWSER, on_progress=on_progress)
+        if status_text.value.startswith("🔥"):
+            status_text.value = "Ready"
+            page.update()
+
+    page.run_task(warm_up)
 
 
 ft.app(target=main)
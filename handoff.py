@@ -0,0 +1,193 @@
+import asyncio
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+from nodriver import cdp
+
+from deadline import http_timeout
+from http_clients import discard_session
+from rate_limit import report_blocked
+
+
+# Set RSP_HTTP_HANDOFF=0 to always render in the browser
+HANDOFF_ENABLED = os.getenv("RSP_HTTP_HANDOFF", "1") != "0"
+
+# After a challenge, stay on the browser path this long before trying HTTP again
+CHALLENGE_COOLDOWN = 10 * 60
+
+# Per supplier: cookie domain and strings that only appear on bot-challenge pages
+_CLOUDFLARE = ("_cf_chl_opt", "Just a moment...", "Attention Required! | Cloudflare")
+SITES = {
+    "Galco": dict(domain="galco.com", markers=_CLOUDFLARE),
+    "Mouser": dict(domain="mouser.com", markers=("px-captcha", "Access Denied", "_Incapsula_Resource")),
+    "Radwell": dict(domain="radwell.com", markers=_CLOUDFLARE),
+}
+
+CHALLENGE_STATUSES = {403, 429, 503}
+
+
+def is_challenge_page(supplier: str, text: str) -> bool:
+    """True when `text` (a page's HTML) carries one of the supplier's bot-challenge markers."""
+    site = SITES.get(supplier)
+    head = (text or "")[:20000]
+    return site is not None and any(m in head for m in site["markers"])
+
+
+# ────────────────────────────────
+# Cookie handoff fetcher
+# ────────────────────────────────
+class HandoffFetcher:
+    """
+    Fetches a supplier's HTML over pooled HTTP, using cookies taken from the browser.
+
+    The same trick RS uses for its search endpoint, made generic: the first
+    lookup renders in the browser as usual and `harvest` copies the site's
+    cookies and the browser's user agent; later lookups `fetch` the pages
+    directly. A challenge page (status or marker) drops the cookies and
+    pauses the fast path for CHALLENGE_COOLDOWN, so the caller falls back to
+    the browser, which re-harvests on its next visit.
+    """
+
+    def __init__(self, supplier: str, domain: str, markers: Tuple[str, ...]):
+        self.supplier = supplier
+        self.domain = domain
+        self.markers = markers
+        self.cookies: Dict[str, str] = {}
+        self.user_agent: Optional[str] = None
+        self.harvested_at = 0.0
+        self.paused_until = 0.0
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        self.hits = 0
+        self.fallbacks = 0
+        self.challenges = 0
+        self.harvests = 0
+
+    def _http(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                cookie_jar=aiohttp.DummyCookieJar(),
+                connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=600, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=20),
+            )
+        return self._session
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.cookies) and time.time() >= self.paused_until
+
+    def is_challenge(self, status: int, text: str) -> bool:
+        head = (text or "")[:20000]
+        return status in CHALLENGE_STATUSES or any(m in head for m in self.markers)
+
+    async def harvest(self, page):
+        """Copy the site's cookies and the user agent from a page the browser just loaded."""
+        try:
+            raw_cookies = await page.send(cdp.storage.get_cookies())
+            user_agent = await page.evaluate("navigator.userAgent")
+        except Exception as e:
+            print(f"[Handoff] {self.supplier}: could not read browser cookies: {e}")
+            return
+
+        cookies = {
+            c.name: c.value
+            for c in raw_cookies
+            if (getattr(c, "domain", "") or "").lstrip(".").endswith(self.domain)
+        }
+        if not cookies:
+            return
+        self.cookies = cookies
+        if isinstance(user_agent, str):
+            self.user_agent = user_agent
+        self.harvested_at = time.time()
+        self.harvests += 1
+
+    async def fetch(self, url: str) -> Optional[Tuple[str, str]]:
+        """(html, final url) over HTTP, or None when the caller should use the browser."""
+        if not self.ready:
+            self.fallbacks += 1
+            return None
+
+        headers = {
+            "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "accept-language": "en-US,en;q=0.9",
+        }
+        if self.user_agent:
+            headers["user-agent"] = self.user_agent
+
+        try:
+            async with self._http().get(url, headers=headers, cookies=self.cookies, timeout=http_timeout(20)) as resp:
+                text = await resp.text(errors="replace")
+                status, final_url = resp.status, str(resp.url)
+                rotated = {name: morsel.value for name, morsel in resp.cookies.items()}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"[Handoff] {self.supplier}: HTTP fetch failed, using the browser: {e}")
+            self.fallbacks += 1
+            return None
+
+        if self.is_challenge(status, text):
+            print(f"[Handoff] {self.supplier}: challenged (HTTP {status}), back to the browser")
+            report_blocked(f"HTTP {status}" if status in CHALLENGE_STATUSES else "challenge page")
+            self.challenges += 1
+            self.cookies = {}
+            self.paused_until = time.time() + CHALLENGE_COOLDOWN
+            self.fallbacks += 1
+            return None
+        if status >= 400:
+            self.fallbacks += 1
+            return None
+
+        self.cookies.update(rotated)
+        self.hits += 1
+        return text, final_url
+
+    def reject(self):
+        """The fetched page was not what the browser would have shown; count it as a fallback."""
+        self.hits -= 1
+        self.fallbacks += 1
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "cookies": len(self.cookies),
+            "age": round(time.time() - self.harvested_at, 1) if self.harvested_at else None,
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "challenges": self.challenges,
+            "harvests": self.harvests,
+        }
+
+
+_FETCHERS: Dict[str, HandoffFetcher] = {}
+_FETCHERS_LOOP = None
+
+
+def get_handoff(supplier: str) -> Optional[HandoffFetcher]:
+    """The supplier's fetcher (one per event loop), or None if it has no HTTP fast path."""
+    global _FETCHERS_LOOP
+    if not HANDOFF_ENABLED or supplier not in SITES:
+        return None
+
+    loop = asyncio.get_running_loop()
+    if _FETCHERS_LOOP is not loop:
+        for fetcher in _FETCHERS.values():
+            discard_session(fetcher._session, _FETCHERS_LOOP)
+        _FETCHERS.clear()
+        _FETCHERS_LOOP = loop
+
+    if supplier not in _FETCHERS:
+        _FETCHERS[supplier] = HandoffFetcher(supplier, **SITES[supplier])
+    return _FETCHERS[supplier]
+
+
+async def close_handoff_clients():
+    for fetcher in list(_FETCHERS.values()):
+        await fetcher.close()
+    _FETCHERS.clear()
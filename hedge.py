@@ -0,0 +1,176 @@
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+# At most this fraction of a supplier's lookups may start a second attempt (0 disables)
+HEDGE_MAX_RATIO = float(os.getenv("RSP_HEDGE_RATIO", "0.1"))
+
+# Latencies kept per supplier, and how many are needed before hedging starts
+LATENCY_WINDOW = 200
+MIN_SAMPLES = 20
+
+# Never hedge sooner than this, whatever the p90 says (seconds)
+MIN_HEDGE_DELAY = 1.0
+
+
+# ────────────────────────────────
+# Latency tracking
+# ────────────────────────────────
+class LatencyTracker:
+    """Rolling window of successful lookup latencies for one supplier."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class HedgePolicy:
+    """
+    Decides when a slow supplier lookup gets a second attempt.
+
+    A lookup still running at the supplier's p90 latency is hedged, as long
+    as fewer than `max_ratio` of that supplier's lookups have been hedged so
+    far, so the extra load stays bounded (10% by default, not 2x).
+    """
+
+    def __init__(self, max_ratio: float = HEDGE_MAX_RATIO, min_samples: int = MIN_SAMPLES):
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.trackers: Dict[str, LatencyTracker] = {}
+        self.lookups: Dict[str, int] = {}
+        self.hedges: Dict[str, int] = {}
+        self.hedge_wins: Dict[str, int] = {}
+
+    def tracker(self, supplier: str) -> LatencyTracker:
+        if supplier not in self.trackers:
+            self.trackers[supplier] = LatencyTracker()
+        return self.trackers[supplier]
+
+    def delay(self, supplier: str) -> Optional[float]:
+        """Seconds to wait before hedging, or None while there is too little data."""
+        tracker = self.tracker(supplier)
+        if self.max_ratio <= 0 or len(tracker.samples) < self.min_samples:
+            return None
+        return max(MIN_HEDGE_DELAY, tracker.quantile(0.9))
+
+    def allow(self, supplier: str) -> bool:
+        return self.hedges.get(supplier, 0) < self.max_ratio * self.lookups.get(supplier, 0)
+
+    def stats(self) -> dict:
+        return {
+            name: {
+                "lookups": self.lookups.get(name, 0),
+                "hedges": self.hedges.get(name, 0),
+                "hedge_wins": self.hedge_wins.get(name, 0),
+                "p50": tracker.quantile(0.5),
+                "p90": tracker.quantile(0.9),
+            }
+            for name, tracker in self.trackers.items()
+        }
+
+
+_POLICY: Optional[HedgePolicy] = None
+
+
+def get_hedge_policy() -> HedgePolicy:
+    global _POLICY
+    if _POLICY is None:
+        _POLICY = HedgePolicy()
+    return _POLICY
+
+
+# ────────────────────────────────
+# Hedged call
+# ────────────────────────────────
+async def hedged(
+    supplier: str,
+    attempt: Callable[[Callable[[], None]], Awaitable[T]],
+    policy: Optional[HedgePolicy] = None,
+    can_hedge: Optional[Callable[[], bool]] = None,
+) -> T:
+    """
+    Await `attempt(begin)`, starting a second attempt if the first is slower than p90.
+
+    An attempt calls `begin()` once it holds its rate-limit slot (and tab) and
+    the supplier call itself starts. Latency is measured from there, and so is
+    the p90 wait before hedging, so time spent queueing for the limiter or the
+    tab pool never counts. A second attempt only starts while `can_hedge()`
+    says it would not queue behind the first.
+
+    The first attempt to come back with a non-empty result wins and the other
+    is cancelled; if both come back empty or fail, the last outcome is used.
+    Only non-empty results are recorded as latency samples (scrapers return
+    an empty list on errors and timeouts).
+    """
+    policy = policy or get_hedge_policy()
+    tracker = policy.tracker(supplier)
+    policy.lookups[supplier] = policy.lookups.get(supplier, 0) + 1
+
+    def _start():
+        began = asyncio.Event()
+        started_at = []
+
+        def begin():
+            if not began.is_set():
+                started_at.append(time.monotonic())
+                began.set()
+
+        async def _timed():
+            result = await attempt(begin)
+            if result and started_at:
+                tracker.record(time.monotonic() - started_at[0])
+            return result
+
+        return asyncio.ensure_future(_timed()), began
+
+    primary, began = _start()
+    delay = policy.delay(supplier)
+    if delay is None:
+        return await primary
+
+    running = asyncio.ensure_future(began.wait())
+    try:
+        await asyncio.wait({primary, running}, return_when=asyncio.FIRST_COMPLETED)
+        if not primary.done():
+            await asyncio.wait({primary}, timeout=delay)
+    except asyncio.CancelledError:
+        primary.cancel()
+        raise
+    finally:
+        running.cancel()
+    if primary.done() or not policy.allow(supplier) or (can_hedge is not None and not can_hedge()):
+        return await primary
+
+    policy.hedges[supplier] = policy.hedges.get(supplier, 0) + 1
+    print(f"[Hedge] {supplier} still running after {delay:.1f}s (p90), starting a second attempt")
+    backup, _ = _start()
+
+    pending = {primary, backup}
+    try:
+        while True:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None and task.result():
+                    if task is backup:
+                        policy.hedge_wins[supplier] = policy.hedge_wins.get(supplier, 0) + 1
+                    return task.result()
+            if not pending:
+                return task.result()  # both empty or failed: the last one's result or error
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,28 @@
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+
+# ────────────────────────────────
+# Clients left behind by a finished event loop
+# ────────────────────────────────
+def discard_session(session: Optional[aiohttp.ClientSession], loop: Optional[asyncio.AbstractEventLoop]):
+    """
+    Close `session`, created on `loop`, from code running on another loop.
+
+    The shared clients are per event loop; when the GUI starts a new loop
+    the old ones must not just be dropped, or their sockets leak and aiohttp
+    warns about unclosed sessions. A loop still running (in another thread)
+    closes its session itself; otherwise the connector's connections are
+    closed here and the session is marked closed.
+    """
+    if session is None or session.closed:
+        return
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+    connector = session.connector
+    session.detach()
+    if connector is not None and loop is not None and not loop.is_closed():
+        connector._close()  # the synchronous part of connector.close()
@@ -0,0 +1,132 @@
+import functools
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+
+# SKU-like title tokens: alphanumeric runs joined by "-" or "/"
+TOKEN_RE = re.compile(r"[A-Za-z0-9]+(?:[-/][A-Za-z0-9]+)*")
+
+
+def normalize(value: str) -> str:
+    """Comparison form of an MPN or scraped part number."""
+    return (value or "").strip().upper()
+
+
+def sku_tokens(title: str) -> List[str]:
+    return TOKEN_RE.findall(normalize(title))
+
+
+@dataclass
+class MpnHit:
+    mpn: str     # the MPN as given to the matcher
+    token: str   # first title token containing it
+    exact: bool  # the token is the MPN itself
+
+
+# ────────────────────────────────
+# Matcher
+# ────────────────────────────────
+class MpnMatcher:
+    """
+    Matches titles and part-number fields against many MPNs at once.
+
+    Built once per batch (or per MPN, see `matcher_for`): exact comparisons
+    go through a hash index of the normalized MPNs, substring hits through an
+    Aho-Corasick automaton, so a title is read once however many MPNs are
+    being looked for.
+    """
+
+    def __init__(self, mpns: Iterable[str]):
+        self._by_norm: Dict[str, List[str]] = {}
+        for mpn in mpns:
+            key = normalize(mpn)
+            if key:
+                self._by_norm.setdefault(key, [])
+                if mpn not in self._by_norm[key]:
+                    self._by_norm[key].append(mpn)
+
+        self._count = sum(len(v) for v in self._by_norm.values())
+
+        # Aho-Corasick automaton over the normalized MPNs
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[str]] = [[]]
+        for key in self._by_norm:
+            self._add(key)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._by_norm)
+
+    def _add(self, pattern: str):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(pattern)
+
+    def _link(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _find(self, text: str) -> Iterator[str]:
+        """Normalized MPNs occurring in `text` (already normalized), in order of their end."""
+        state = 0
+        for ch in text:
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            yield from self._out[state]
+
+    # ── public API ──
+    def exact(self, value: str) -> List[str]:
+        """MPNs equal to `value` (case and surrounding whitespace ignored)."""
+        return self._by_norm.get(normalize(value), [])
+
+    def exact_tokens(self, tokens: Iterable[str]) -> Set[str]:
+        """MPNs equal to any of `tokens`."""
+        return {mpn for t in tokens for mpn in self.exact(t)}
+
+    def substrings(self, text: str) -> Set[str]:
+        """MPNs occurring anywhere in `text`."""
+        return {mpn for key in self._find(normalize(text)) for mpn in self._by_norm[key]}
+
+    def scan(self, title: str, tokens: Optional[List[str]] = None) -> Dict[str, MpnHit]:
+        """
+        Every MPN contained in one of the title's tokens, with the first such token.
+
+        `tokens` defaults to sku_tokens(title); pass another tokenization to
+        keep a caller's own splitting rules.
+        """
+        hits: Dict[str, MpnHit] = {}
+        for token in tokens if tokens is not None else sku_tokens(title):
+            token = normalize(token)
+            for key in self._find(token):
+                for mpn in self._by_norm[key]:
+                    if mpn not in hits:
+                        hits[mpn] = MpnHit(mpn, token, token == key)
+            if len(hits) == self._count:
+                break
+        return hits
+
+
+@functools.lru_cache(maxsize=1024)
+def matcher_for(mpn: str) -> MpnMatcher:
+    """Cached single-MPN matcher for the per-lookup scrapers."""
+    return MpnMatcher([mpn])
@@ -11,6 +11,7 @@ class ProviderResult(BaseModel):
     url: Optional[str] = None
     exact_match: Optional[bool] = None
     scraped_sku: Optional[str]= None
+    not_carried: bool = False  # the supplier's own "no results" answer (see cache.is_miss)
 
 class SearchResponse(BaseModel):
     query: str
@@ -0,0 +1,142 @@
+import asyncio
+import base64
+import json
+import re
+import time
+from typing import Any, Callable, Dict, Optional
+
+from nodriver import cdp
+
+from deadline import clamp
+
+
+# ────────────────────────────────
+# JSON response capture
+# ────────────────────────────────
+class JsonCapture:
+    """
+    Collects the JSON bodies a tab receives, through the CDP Network domain.
+
+    Wrap the navigation in `async with JsonCapture(tab, r"example\\.com/api")`
+    and call `first(pick)`: every JSON response whose URL matches is decoded
+    as soon as it has finished loading, and the first `pick(body)` that is
+    not None is returned, without waiting for the page to render it.
+    """
+
+    def __init__(self, tab, url_pattern: str, max_body: int = 8 * 1024 * 1024):
+        self.tab = tab
+        self.url_re = re.compile(url_pattern, re.I)
+        self.max_body = max_body
+        self._pending: Dict[Any, str] = {}
+        self._reads = set()
+        self._bodies: asyncio.Queue = asyncio.Queue()
+        self._owns_network = False
+        self.seen = 0
+
+    async def __aenter__(self):
+        # The resource filter keeps Network on for pooled tabs; only undo our own enable
+        self._owns_network = cdp.network not in self.tab.enabled_domains
+        self.tab.add_handler(cdp.network.ResponseReceived, self._on_response)
+        self.tab.add_handler(cdp.network.LoadingFinished, self._on_finished)
+        await self.tab.send(cdp.network.enable())
+        return self
+
+    async def __aexit__(self, *exc):
+        for event, handler in (
+            (cdp.network.ResponseReceived, self._on_response),
+            (cdp.network.LoadingFinished, self._on_finished),
+        ):
+            # Connection.remove_handler(event, handler) drops every handler of the event
+            handlers = self.tab.handlers.get(event, [])
+            if handler in handlers:
+                handlers.remove(handler)
+        for task in self._reads:
+            task.cancel()
+        if self._owns_network:
+            if cdp.network in self.tab.enabled_domains:
+                self.tab.enabled_domains.remove(cdp.network)
+            try:
+                await self.tab.send(cdp.network.disable())
+            except Exception:
+                pass  # the tab closed; nothing left to stream
+        return False
+
+    def _on_response(self, event: cdp.network.ResponseReceived, tab=None):
+        response = event.response
+        if "json" in (response.mime_type or "") and self.url_re.search(response.url):
+            self._pending[event.request_id] = response.url
+
+    def _on_finished(self, event: cdp.network.LoadingFinished, tab=None):
+        url = self._pending.pop(event.request_id, None)
+        if url is None or event.encoded_data_length > self.max_body:
+            return
+        task = asyncio.ensure_future(self._read(event.request_id, url))
+        self._reads.add(task)
+        task.add_done_callback(self._reads.discard)
+
+    async def _read(self, request_id, url: str):
+        try:
+            body, is_base64 = await self.tab.send(cdp.network.get_response_body(request_id))
+            if is_base64:
+                body = base64.b64decode(body).decode("utf-8", "replace")
+            data = json.loads(body)
+        except Exception:
+            return  # evicted from the buffer, or not JSON after all
+        self.seen += 1
+        self._bodies.put_nowait((url, data))
+
+    async def first(self, pick: Callable[[Any], Optional[Any]], timeout: float = 10) -> Optional[Any]:
+        """The first non-None `pick(body)` over captured bodies, or None after `timeout`."""
+        deadline = time.monotonic() + clamp(timeout)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                _, data = await asyncio.wait_for(self._bodies.get(), remaining)
+            except asyncio.TimeoutError:
+                return None
+            picked = pick(data)
+            if picked is not None:
+                return picked
+
+
+async def read_next_data(tab) -> Optional[Any]:
+    """The page's embedded Next.js state (__NEXT_DATA__), if it has one."""
+    try:
+        text = await tab.evaluate(
+            "(document.getElementById('__NEXT_DATA__') || {}).textContent || ''", return_by_value=True
+        )
+        return json.loads(text) if isinstance(text, str) and text else None
+    except Exception:
+        return None
+
+
+# ────────────────────────────────
+# Tolerant key search
+# ────────────────────────────────
+def key_name(key: str) -> str:
+    """'QuantityAvailable', 'quantity_available' and 'quantityAvailable' all compare equal."""
+    return re.sub(r"[^a-z]", "", str(key).lower())
+
+
+def walk_dicts(obj):
+    """Every dict nested anywhere in a decoded JSON document, parents first."""
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def find_value(obj, keys: set):
+    """First value (depth first) stored under one of `keys` (compared with key_name)."""
+    for node in walk_dicts(obj):
+        for k, v in node.items():
+            if key_name(k) in keys and v not in (None, "", [], {}):
+                return v
+    return None
+
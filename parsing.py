@@ -0,0 +1,151 @@
+import os
+import re
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+# ────────────────────────────────
+# Parser backend
+# ────────────────────────────────
+def _default_parser() -> str:
+    try:
+        import lxml  # noqa: F401  (optional C parser, much faster than html.parser)
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+
+HTML_PARSER = os.getenv("RSP_HTML_PARSER") or _default_parser()
+
+
+# ────────────────────────────────
+# Scoped parsing
+# ────────────────────────────────
+class Scope(SoupStrainer):
+    """
+    parse_only filter that keeps the whole subtree of every tag matching any rule.
+
+    A rule is (tag name or None, {attr: value}), where value is a string, a
+    compiled regex or True, matched the way `soup.find(name, attrs)` matches
+    (so "class" values match any single class or the full class string).
+    Everything else is dropped while parsing.
+
+    As long as a parser's top-level find/select calls are all covered by the
+    scope (and nested lookups only happen inside the nodes they return), it
+    gets exactly the same nodes from the scoped tree as from the full one.
+    """
+
+    def __init__(self, *rules):
+        super().__init__()
+        self.rules = rules
+
+    @staticmethod
+    def _value_matches(attr: str, actual, expected) -> bool:
+        if actual is None:
+            return False
+        if isinstance(actual, (list, tuple)):
+            actual = " ".join(actual)
+        if expected is True:
+            return True
+        candidates = [actual] + (actual.split() if attr == "class" else [])
+        if hasattr(expected, "search"):
+            return any(expected.search(c) for c in candidates)
+        return expected in candidates
+
+    def _matches(self, name: str, attrs) -> bool:
+        attrs = attrs or {}
+        for rule_name, rule_attrs in self.rules:
+            if rule_name is not None and rule_name != name:
+                continue
+            if all(self._value_matches(a, attrs.get(a), v) for a, v in rule_attrs.items()):
+                return True
+        return False
+
+    # Beautiful Soup >= 4.13
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self._matches(name, attrs)
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+    @property
+    def includes_everything(self) -> bool:
+        return False
+
+    @property
+    def excludes_everything(self) -> bool:
+        return False
+
+    # Beautiful Soup < 4.13
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        if not isinstance(markup_name, str):
+            return None
+        return markup_name if self._matches(markup_name, dict(markup_attrs or {})) else None
+
+
+# Every node the supplier parsers in providers.py look up at the top level
+_DIGIKEY_PRODUCT = (
+    ("div", {"data-evg": "price-procurement-wrapper"}),
+    ("tr", {"data-testid": "overview-manufacturer"}),
+    ("td", {"data-testid": "mfr-number"}),
+)
+_GALCO_PRODUCT = (
+    ("div", {"itemprop": "MFG Item Number"}),
+    (None, {"class": "stock-number"}),
+    (None, {"class": "price"}),
+)
+_MOUSER_PRODUCT = (
+    (None, {"data-testid": "RestrictedAvailabilityTrigger"}),
+    ("a", {"id": "lnkManufacturerName"}),
+    ("span", {"id": "spnManufacturerPartNumber"}),
+    ("h2", {"data-testid": "PricingAvailabilityHeader"}),
+    ("tr", {"data-testid": "PricingTablePriceBreakRow"}),
+)
+_RADWELL_PRODUCT = (
+    ("div", {"class": "option"}),
+    ("span", {"class": "pdp-part-number"}),
+    ("div", {"class": "manufacturer-container"}),
+)
+
+SCOPES = {
+    "Digi-Key search": Scope(
+        ("div", {"class": re.compile("blocked|captcha|access")}),
+        ("div", {"data-testid": "category-exact-match"}),
+        ("div", {"data-testid": "sb-content-container"}),
+        (None, {"class": re.compile("noResultsText")}),
+        *_DIGIKEY_PRODUCT,
+    ),
+    "Digi-Key product": Scope(*_DIGIKEY_PRODUCT),
+    "Galco search": Scope(
+        ("div", {"class": "no-results"}),
+        ("div", {"class": "product-info-main"}),
+        ("div", {"class": "product main-details"}),
+        *_GALCO_PRODUCT,
+    ),
+    "Galco product": Scope(*_GALCO_PRODUCT),
+    "Mouser search": Scope(
+        ("div", {"id": "pdpPricingAvailability"}),
+        ("tr", {"data-partnumber": True}),
+        ("div", {"class": "no-results-heading"}),
+        *_MOUSER_PRODUCT,
+    ),
+    "Mouser product": Scope(*_MOUSER_PRODUCT),
+    "Radwell search": Scope(
+        ("div", {"class": "rd-buyOpts"}),
+        (None, {"id": "searchResults"}),
+        *_RADWELL_PRODUCT,
+    ),
+    "Radwell product": Scope(*_RADWELL_PRODUCT),
+}
+
+
+def make_soup(html: str, scope: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parse HTML with the configured backend (lxml when installed).
+
+    `scope` names an entry of SCOPES; only the containers that supplier's
+    parser reads are built, which skips most of a product page.
+    """
+    parse_only = SCOPES[scope] if scope else None
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
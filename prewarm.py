@@ -0,0 +1,143 @@
+import asyncio
+import os
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from readiness import wait_ready
+from registry import LazyBrowser, TabLease
+from tab_pool import get_tab_pool
+
+
+# Set RSP_PREWARM=0 to skip the warm-up and pay for it on the first search
+PREWARM_ENABLED = os.getenv("RSP_PREWARM", "1") != "0"
+
+# Give up on one supplier's warm-up after this long (seconds)
+PREWARM_TIMEOUT = 25
+
+# Browser suppliers: the page visited to resolve DNS, open TLS and collect cookies
+ORIGINS = {
+    "Digi-Key": "https://www.digikey.com/",
+    "Mouser": "https://www.mouser.com/",
+    "Galco": "https://www.galco.com/",
+    "Radwell": "https://www.radwell.com/",
+}
+
+
+def print_progress(name: str, state: str, seconds: float):
+    if state != "warming":
+        print(f"[Prewarm] {name}: {state} ({seconds:.1f}s)")
+
+
+# ────────────────────────────────
+# Per supplier
+# ────────────────────────────────
+async def _warm_origin(name: str, browser) -> bool:
+    """
+    Visit the supplier's home page on a pooled tab, so the tab stays on that origin.
+
+    Skipped (False) when every tab is busy: lookups are not kept waiting for a warm-up.
+    """
+    from handoff import get_handoff
+
+    pool = get_tab_pool(browser)
+    if not pool.has_free():
+        return False
+    async with pool.tab(name) as tab:
+        await tab.get(ORIGINS[name])
+        await wait_ready(tab, timeout=10, require_loaded=True, required=False)
+        handoff = get_handoff(name)
+        if handoff is not None:
+            await handoff.harvest(tab)
+    return True
+
+
+async def _warm_rs(browser):
+    """Load the shared DataDome session from disk, or bootstrap it on a pooled tab."""
+    from rs_session import get_rs_session_manager
+
+    lease = TabLease(browser, "RS Online")  # Chrome only if the saved session is missing or old
+    try:
+        await get_rs_session_manager().get_cookies(lease)
+    finally:
+        await lease.release()
+
+
+async def warm_supplier(name: str, browser) -> bool:
+    """Warm one supplier; returns False when there is nothing to warm."""
+    if name == "eBay":
+        from suppliers.ebay import ebay_credentials
+        from ebay import get_ebay_client
+
+        await get_ebay_client(*ebay_credentials()).token()  # OAuth token plus a pooled TLS connection
+        return True
+    if name != "RS Online" and name not in ORIGINS:
+        return False
+    if browser is None:
+        return False
+    if name == "RS Online":
+        await _warm_rs(browser)
+        return True
+    if isinstance(browser, LazyBrowser):
+        browser = browser.browser  # prewarm only calls this once Chrome is up
+    return await _warm_origin(name, browser)
+
+
+# ────────────────────────────────
+# Warm-up stage
+# ────────────────────────────────
+async def prewarm(
+    suppliers: Iterable[str],
+    browser,
+    on_progress: Optional[Callable[[str, str, float], None]] = print_progress,
+    timeout: float = PREWARM_TIMEOUT,
+) -> Dict[str, str]:
+    """
+    Warm every supplier in `suppliers` at the same time, before the first search.
+
+    `browser` may be a LazyBrowser. The warm-up never launches it: the
+    supplier origins are only visited once a real lookup has started Chrome
+    (state "until Chrome starts" until then), so API-only and fully cached
+    runs never start it. RS loads its saved session and only takes a tab
+    when that session is missing or too old.
+    `on_progress(name, state, seconds)` is called with "warming" and then
+    "warm", "skipped", "timed out" or "failed: ...". A failed warm-up only
+    means the first real lookup does the work, so nothing is raised.
+    """
+    if not PREWARM_ENABLED:
+        return {}
+
+    suppliers = list(suppliers)
+    deferred = []
+    if isinstance(browser, LazyBrowser) and not browser.launched:
+        deferred = [name for name in suppliers if name in ORIGINS]
+        suppliers = [name for name in suppliers if name not in ORIGINS]
+
+    async def _one(name: str) -> str:
+        started = time.monotonic()
+        if on_progress:
+            on_progress(name, "warming", 0.0)
+        try:
+            warmed = await asyncio.wait_for(warm_supplier(name, browser), timeout)
+            state = "warm" if warmed else "skipped"
+        except asyncio.TimeoutError:
+            state = "timed out"
+        except Exception as e:
+            state = f"failed: {e}"
+        if on_progress:
+            on_progress(name, state, time.monotonic() - started)
+        return state
+
+    async def _all(names) -> Dict[str, str]:
+        started = time.monotonic()
+        states = await asyncio.gather(*(_one(name) for name in names))
+        print(f"[Prewarm] Done in {time.monotonic() - started:.1f}s")
+        return dict(zip(names, states))
+
+    if deferred:
+        browser.when_launched(lambda: _all(deferred))
+        for name in deferred:
+            if on_progress:
+                on_progress(name, "until Chrome starts", 0.0)
+    states = await _all(suppliers) if suppliers else {}
+    states.update((name, "until Chrome starts") for name in deferred)
+    return states
@@ -0,0 +1,231 @@
+import asyncio
+import contextvars
+import functools
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+
+# ────────────────────────────────
+# Per-supplier defaults
+# ────────────────────────────────
+# One token = one scrape_* call. `rate` is tokens per second, `burst` the bucket
+# size, and the concurrency limit moves between `min_limit` and `max_limit`.
+LIMITS = {
+    "Digi-Key": dict(rate=0.5, burst=2, initial=2, min_limit=1, max_limit=4),
+    "Mouser": dict(rate=0.5, burst=2, initial=2, min_limit=1, max_limit=4),
+    "RS Online": dict(rate=0.3, burst=1, initial=1, min_limit=1, max_limit=3),  # DataDome
+    "Galco": dict(rate=1.0, burst=3, initial=2, min_limit=1, max_limit=6),
+    "Radwell": dict(rate=1.0, burst=3, initial=2, min_limit=1, max_limit=6),
+    "eBay": dict(rate=4.0, burst=8, initial=8, min_limit=2, max_limit=16),
+}
+DEFAULT_LIMIT = dict(rate=1.0, burst=2, initial=2, min_limit=1, max_limit=4)
+
+BLOCK_STATUSES = {403, 429, 503}
+
+
+# ────────────────────────────────
+# Token bucket
+# ────────────────────────────────
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, at most `burst` saved up."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def available(self) -> float:
+        """Tokens in the bucket right now, without taking any."""
+        return min(self.burst, self.tokens + (time.monotonic() - self.updated) * self.rate)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        async with self._lock:  # waiters are served in arrival order
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# ────────────────────────────────
+# AIMD concurrency
+# ────────────────────────────────
+class AIMDController:
+    """
+    Concurrency limit that grows by `increase / limit` per clean response
+    (about +1 per full window) and is multiplied by `decrease` on a block.
+    After a block new work also waits `cooldown` seconds.
+    """
+
+    def __init__(self, initial: int, min_limit: int, max_limit: int,
+                 increase: float = 1.0, decrease: float = 0.5, cooldown: float = 10.0):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._cond:
+            while self.in_flight >= int(self.limit):
+                await self._cond.wait()
+            self.in_flight += 1
+
+    async def wait_cooldown(self):
+        wait = self.blocked_until - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def release(self):
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self):
+        self.limit = min(self.max_limit, self.limit + self.increase / max(self.limit, 1.0))
+
+    def on_block(self):
+        self.limit = max(self.min_limit, self.limit * self.decrease)
+        self.blocked_until = time.monotonic() + self.cooldown
+
+
+# ────────────────────────────────
+# Supplier limiter
+# ────────────────────────────────
+class _Slot:
+    def __init__(self, supplier: str):
+        self.supplier = supplier
+        self.blocked: Optional[str] = None
+        self.calls = 0  # scrape_* calls made under this slot
+
+
+_current_slot: contextvars.ContextVar[Optional[_Slot]] = contextvars.ContextVar("rate_limit_slot", default=None)
+
+
+class SupplierLimiter:
+    """Token bucket plus AIMD controller for one supplier."""
+
+    def __init__(self, supplier: str, rate: float, burst: float, initial: int, min_limit: int, max_limit: int):
+        self.supplier = supplier
+        self.bucket = TokenBucket(rate, burst)
+        self.controller = AIMDController(initial, min_limit, max_limit)
+
+        self.calls = 0
+        self.blocks = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one concurrency slot and one token for the duration of a lookup."""
+        await self.controller.acquire()
+        slot = _Slot(self.supplier)
+        token = _current_slot.set(slot)
+        clean = False
+        try:
+            await self.controller.wait_cooldown()
+            await self.bucket.acquire()
+            self.calls += 1
+            yield slot
+            clean = True
+        except Exception as e:
+            if status_of(e) in BLOCK_STATUSES:
+                slot.blocked = f"HTTP {status_of(e)}"
+            raise
+        finally:
+            _current_slot.reset(token)
+            if slot.blocked:
+                self.blocks += 1
+                self.controller.on_block()
+                print(f"[RateLimit] {self.supplier} blocked ({slot.blocked}), "
+                      f"concurrency -> {int(self.controller.limit)}")
+            elif clean:
+                self.controller.on_success()
+            await self.controller.release()
+
+    def has_capacity(self) -> bool:
+        """True when a new lookup would get a slot and a token right away."""
+        controller = self.controller
+        return (
+            controller.in_flight < int(controller.limit)
+            and time.monotonic() >= controller.blocked_until
+            and self.bucket.available() >= 1
+        )
+
+    def stats(self) -> dict:
+        return {
+            "supplier": self.supplier,
+            "limit": int(self.controller.limit),
+            "in_flight": self.controller.in_flight,
+            "calls": self.calls,
+            "blocks": self.blocks,
+        }
+
+
+def status_of(exc: BaseException) -> Optional[int]:
+    """HTTP status carried by an aiohttp or requests error, if any."""
+    status = getattr(exc, "status", None)
+    if status is None:
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+_LIMITERS: Dict[str, SupplierLimiter] = {}
+
+
+def get_limiter(supplier: str) -> SupplierLimiter:
+    limiter = _LIMITERS.get(supplier)
+    if limiter is None:
+        limiter = SupplierLimiter(supplier, **LIMITS.get(supplier, DEFAULT_LIMIT))
+        _LIMITERS[supplier] = limiter
+    return limiter
+
+
+def report_blocked(reason: str):
+    """Called by a scraper that hit a blocker, captcha, 429 or DataDome challenge."""
+    slot = _current_slot.get()
+    if slot is not None:
+        slot.blocked = reason
+
+
+def rate_limited(supplier: str):
+    """
+    Decorator that runs a scrape_* coroutine through the supplier's limiter.
+
+    Under a slot the caller already holds (search.run_supplier takes it before
+    borrowing a tab) the first call is covered by that slot's token; nested
+    calls for the same supplier (Galco's `_retry`) only take another token,
+    not a second concurrency slot, so they can never deadlock on the limit.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            limiter = get_limiter(supplier)
+            current = _current_slot.get()
+            if current is not None and current.supplier == supplier:
+                if current.calls:
+                    await limiter.bucket.acquire()
+                current.calls += 1
+                return await fn(*args, **kwargs)
+
+            async with limiter.slot() as slot:
+                slot.calls += 1
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import time
+from typing import Optional
+
+from deadline import clamp
+
+
+# ────────────────────────────────
+# In-page wait scripts
+# ────────────────────────────────
+# Resolves as soon as the condition holds: re-checked on every DOM mutation and
+# on a short interval (for conditions such as cookies that mutate no nodes).
+_READY_JS = """
+new Promise((resolve) => {
+    const selector = %(selector)s;
+    const requireLoaded = %(require_loaded)s;
+    const started = performance.now();
+    const check = () => {
+        if (requireLoaded && document.readyState === "loading") return false;
+        if (selector && !document.querySelector(selector)) return false;
+        return Boolean(%(predicate)s);
+    };
+    let observer = null, poll = null, timer = null;
+    const finish = (ok) => {
+        if (observer) observer.disconnect();
+        clearInterval(poll);
+        clearTimeout(timer);
+        resolve({ok: ok, ms: Math.round(performance.now() - started)});
+    };
+    if (check()) return finish(true);
+    observer = new MutationObserver(() => { if (check()) finish(true); });
+    observer.observe(document, {childList: true, subtree: true, attributes: true});
+    document.addEventListener("readystatechange", () => { if (check()) finish(true); });
+    poll = setInterval(() => { if (check()) finish(true); }, 100);
+    timer = setTimeout(() => finish(false), %(timeout_ms)d);
+})
+"""
+
+# Scrolls to the bottom (to trigger lazy content) and resolves once the DOM
+# has been quiet for `quiet_ms`, or after `timeout_ms`.
+_SETTLE_JS = """
+new Promise((resolve) => {
+    const started = performance.now();
+    let quiet = null;
+    const finish = (ok) => {
+        observer.disconnect();
+        clearTimeout(quiet);
+        clearTimeout(limit);
+        resolve({ok: ok, ms: Math.round(performance.now() - started)});
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quiet);
+        quiet = setTimeout(() => finish(true), %(quiet_ms)d);
+    });
+    observer.observe(document, {childList: true, subtree: true});
+    const limit = setTimeout(() => finish(false), %(timeout_ms)d);
+    quiet = setTimeout(() => finish(true), %(quiet_ms)d);
+    window.scrollTo(0, document.body ? document.body.scrollHeight : 0);
+})
+"""
+
+
+async def _run_until(page, script: str, timeout: float) -> Optional[dict]:
+    """
+    Evaluate a wait script, re-arming it if a navigation destroys the JS context.
+
+    Returns the script's {ok, ms} result, or None when `timeout` ran out.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        try:
+            result = await asyncio.wait_for(
+                page.evaluate(script, await_promise=True, return_by_value=True),
+                timeout=remaining + 1,
+            )
+        except asyncio.TimeoutError:
+            return None
+        except Exception:
+            result = None  # context destroyed by a navigation
+        if isinstance(result, dict):
+            return result
+        # No value back: the document was replaced mid-wait, try again on the new one
+        await asyncio.sleep(0.1)
+
+
+# ────────────────────────────────
+# Public API
+# ────────────────────────────────
+async def wait_ready(
+    page,
+    selector: Optional[str] = None,
+    predicate: Optional[str] = None,
+    timeout: float = 10,
+    require_loaded: bool = False,
+    required: bool = True,
+) -> bool:
+    """
+    Wait until the page is usable, instead of sleeping a fixed time.
+
+    Resolves as soon as `selector` matches (any of a comma separated list),
+    the JS expression `predicate` is truthy, and — with `require_loaded` — the
+    document has finished parsing. Raises asyncio.TimeoutError after `timeout`
+    seconds when `required`, like nodriver's `page.wait_for`; otherwise returns
+    False so the caller can carry on with whatever has loaded. `timeout` is
+    cut short by the search deadline, if there is one (see deadline.py).
+    """
+    timeout = clamp(timeout)
+    script = _READY_JS % {
+        "selector": json.dumps(selector or ""),
+        "predicate": predicate or "true",
+        "require_loaded": "true" if require_loaded else "false",
+        "timeout_ms": int(timeout * 1000),
+    }
+    result = await _run_until(page, script, timeout)
+    ok = bool(result and result.get("ok"))
+
+    if not ok and required:
+        raise asyncio.TimeoutError(f"page not ready after {timeout}s (selector={selector!r})")
+    return ok
+
+
+async def wait_settled(page, quiet_ms: int = 150, timeout: float = 1.5) -> bool:
+    """Scroll to the bottom and wait for the DOM to stop changing (bounded by `timeout`)."""
+    timeout = clamp(timeout)
+    script = _SETTLE_JS % {"quiet_ms": quiet_ms, "timeout_ms": int(timeout * 1000)}
+    result = await _run_until(page, script, timeout)
+    return bool(result and result.get("ok"))
@@ -0,0 +1,200 @@
+import asyncio
+import importlib
+import sys
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+
+# ────────────────────────────────
+# Provider specs
+# ────────────────────────────────
+@dataclass(frozen=True)
+class ProviderSpec:
+    """
+    One supplier and what it needs to run.
+
+    The scraper is named, not imported: its module (under suppliers/) is
+    only loaded the first time the supplier is actually used.
+    """
+    name: str
+    module: str                  # e.g. "suppliers.digikey"
+    function: str                # scraper defined in `module`
+    needs_browser: bool = True   # drives Chrome (on a pooled tab); False for pure API providers
+    tab_on_demand: bool = False  # Chrome is only a fallback (HTTP handoff, saved session): take the tab on first use
+    needs_brand: bool = False    # scraper takes (mpn, manufacturer, browser=...)
+    cacheable: bool = True       # answers may be served from the offer / miss caches
+    batch: Optional[str] = None  # function in `module` that turns on cross-lookup request batching
+
+    @property
+    def supports_batch(self) -> bool:
+        return self.batch is not None
+
+    def load(self, attr: str) -> Callable:
+        return getattr(importlib.import_module(self.module), attr)
+
+    @property
+    def scraper(self) -> Callable:
+        return self.load(self.function)
+
+    async def call(self, mpn: str, manufacturer: str, browser=None):
+        if self.needs_brand:
+            return await self.scraper(mpn, manufacturer, browser=browser)
+        return await self.scraper(mpn, browser=browser)
+
+
+PROVIDERS: Dict[str, ProviderSpec] = {
+    spec.name: spec
+    for spec in (
+        ProviderSpec("Digi-Key", "suppliers.digikey", "scrape_digikey"),
+        ProviderSpec("Mouser", "suppliers.mouser", "scrape_mouser", tab_on_demand=True),
+        ProviderSpec("RS Online", "suppliers.rs", "scrape_rs", tab_on_demand=True),
+        ProviderSpec("Galco", "suppliers.galco", "scrape_galco", needs_brand=True, tab_on_demand=True),
+        ProviderSpec("eBay", "suppliers.ebay", "scrape_ebay", needs_browser=False, batch="enable_ebay_batching"),
+        ProviderSpec("Radwell", "suppliers.radwell", "scrape_radwell", tab_on_demand=True),
+    )
+}
+
+
+def get_provider(name: str) -> ProviderSpec:
+    return PROVIDERS[name]
+
+
+def needs_browser(names: Iterable[str]) -> bool:
+    return any(PROVIDERS[name].needs_browser for name in names)
+
+
+def enable_batching(names: Iterable[str]):
+    """Turn on batching for every selected provider that supports it (batch runs)."""
+    for name in names:
+        spec = PROVIDERS[name]
+        if spec.supports_batch:
+            spec.load(spec.batch)()
+
+
+# ────────────────────────────────
+# Browser on demand
+# ────────────────────────────────
+class LazyBrowser:
+    """
+    Stands in for the browser until a provider actually needs one.
+
+    `launch` is only called by the first `get()` (concurrent callers share
+    that launch), so an eBay-only search, or one answered from the cache,
+    never starts Chrome. Work that only makes sense once Chrome runs (such
+    as warming the supplier origins) is queued with `when_launched()`.
+    """
+
+    def __init__(self, launch: Callable[[], Awaitable]):
+        self._launch = launch
+        self._task: Optional[asyncio.Future] = None
+        self._waiting = []
+        self._started = set()
+        self.browser = None
+
+    async def get(self):
+        if self.browser is not None:
+            return self.browser
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._launch())
+        try:
+            browser = await asyncio.shield(self._task)
+        except Exception:
+            self._task = None  # let the next caller try again
+            raise
+        if self.browser is None:
+            self.browser = browser
+            waiting, self._waiting = self._waiting, []
+            for callback in waiting:
+                self._start(callback)
+        return self.browser
+
+    def when_launched(self, callback: Callable[[], Awaitable]):
+        """Run `callback()` in the background once Chrome is up (right away if it already is)."""
+        if self.launched:
+            self._start(callback)
+        else:
+            self._waiting.append(callback)
+
+    def _start(self, callback):
+        task = asyncio.ensure_future(callback())
+        self._started.add(task)
+        task.add_done_callback(self._started.discard)
+
+    @property
+    def launched(self) -> bool:
+        return self.browser is not None
+
+
+async def resolve_browser(browser):
+    """The real browser behind `browser` (which may be a LazyBrowser or None)."""
+    if isinstance(browser, LazyBrowser):
+        return await browser.get()
+    return browser
+
+
+class TabLease:
+    """
+    Stands in for a pooled tab until the scraper actually navigates.
+
+    Passed as `browser` to providers whose fast path needs no Chrome (RS's
+    saved DataDome session, the cookie handoff): the first `get(url)`
+    launches the browser if needed and checks out a tab for `supplier`, so a
+    lookup the fast path answers never starts Chrome or holds a tab.
+    Call `release()` when the lookup is done.
+    """
+
+    def __init__(self, browser, supplier: str):
+        self._browser = browser
+        self.supplier = supplier
+        self.tab = None
+        self._pool = None
+
+    async def acquire(self):
+        if self.tab is None:
+            from tab_pool import get_tab_pool
+
+            real_browser = await resolve_browser(self._browser)
+            if real_browser is None:
+                raise RuntimeError(f"{self.supplier} needs the browser, but none was given")
+            self._pool = get_tab_pool(real_browser)
+            self.tab = await self._pool.checkout(self.supplier)
+        return self.tab
+
+    async def get(self, url: str = "about:blank", new_tab: bool = False, new_window: bool = False):
+        tab = await self.acquire()
+        return await tab.get(url)
+
+    async def release(self):
+        if self.tab is not None:
+            tab, self.tab = self.tab, None
+            await self._pool.checkin(tab, self.supplier)
+
+
+# ────────────────────────────────
+# Shutdown
+# ────────────────────────────────
+# Shared HTTP clients, as (module, close coroutine); a module never imported has none open
+_CLIENT_CLOSERS = (
+    ("rs_session", "close_rs_http"),
+    ("ebay", "close_ebay_clients"),
+    ("handoff", "close_handoff_clients"),
+)
+
+
+async def close_clients():
+    """Close the shared HTTP clients of the providers that actually ran."""
+    for module, closer in _CLIENT_CLOSERS:
+        if module in sys.modules:
+            await getattr(sys.modules[module], closer)()
+
+
+def stop_browser(browser):
+    """Print the resource filter's report and stop Chrome, if it was ever launched."""
+    if browser is None or not browser.launched:
+        return
+    from resources import get_resource_filter
+
+    resource_filter = get_resource_filter()
+    if resource_filter is not None:
+        resource_filter.report()
+    browser.browser.stop()
@@ -0,0 +1,167 @@
+import os
+from fnmatch import fnmatchcase
+from typing import Dict, Optional
+
+from nodriver import cdp
+
+
+# Set RSP_BLOCK_RESOURCES=0 to let pages load everything
+BLOCKING_ENABLED = os.getenv("RSP_BLOCK_RESOURCES", "1") != "0"
+
+_HEAVY = ("Image", "Font", "Media")
+
+# Per supplier: resource types to drop, whether to drop trackers, and URL
+# substrings that are always let through (e.g. bot-check scripts and pixels)
+RULES = {
+    "Digi-Key": dict(types=_HEAVY, trackers=True, allow=()),
+    "Mouser": dict(types=_HEAVY, trackers=True, allow=()),
+    "Galco": dict(types=_HEAVY, trackers=True, allow=("challenge-platform",)),
+    "Radwell": dict(types=_HEAVY, trackers=True, allow=("challenge-platform",)),
+    "RS Online": dict(types=_HEAVY, trackers=True, allow=("datadome",)),
+}
+DEFAULT_RULE = dict(types=(), trackers=False, allow=())
+
+# Third-party analytics / ads, blocked before the request is sent
+TRACKERS = (
+    "*google-analytics.com/*",
+    "*googletagmanager.com/*",
+    "*googleadservices.com/*",
+    "*doubleclick.net/*",
+    "*connect.facebook.net/*",
+    "*bat.bing.com/*",
+    "*clarity.ms/*",
+    "*hotjar.com/*",
+    "*criteo.com/*",
+    "*adsrvr.org/*",
+    "*px.ads.linkedin.com/*",
+    "*snap.licdn.com/*",
+    "*quantserve.com/*",
+    "*demdex.net/*",
+    "*omtrdc.net/*",
+)
+
+
+def is_tracker(url: str) -> bool:
+    """True when `url` matches one of the TRACKERS patterns."""
+    return any(fnmatchcase(url, p) for p in TRACKERS)
+
+
+# ────────────────────────────────
+# Per-tab request filter
+# ────────────────────────────────
+class ResourceFilter:
+    """
+    Drops images, fonts, media and trackers on pooled tabs through the CDP Fetch domain.
+
+    Heavy resource types are paused at the Response stage, so their
+    Content-Length can be counted as blocked bytes before they are failed;
+    trackers are failed at the Request stage and only counted. What the
+    page does load is summed from Network.loadingFinished. The rules follow
+    the supplier the tab is currently lent to (see TabPool.checkout).
+    """
+
+    def __init__(self):
+        self._installed = set()
+        self._supplier: Dict[int, Optional[str]] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, supplier: Optional[str], key: str, amount: int = 1):
+        counters = self.counters.setdefault(supplier or "-", {
+            "blocked_requests": 0, "blocked_bytes": 0, "allowed_requests": 0, "allowed_bytes": 0,
+        })
+        counters[key] += amount
+
+    async def attach(self, tab, supplier: Optional[str]):
+        """Install the filter on `tab` (once) and apply `supplier`'s rules from now on."""
+        self._supplier[id(tab)] = supplier
+        if id(tab) in self._installed:
+            return
+
+        patterns = [
+            cdp.fetch.RequestPattern(
+                resource_type=cdp.network.ResourceType(t), request_stage=cdp.fetch.RequestStage.RESPONSE
+            )
+            for t in _HEAVY
+        ] + [
+            cdp.fetch.RequestPattern(url_pattern=p, request_stage=cdp.fetch.RequestStage.REQUEST)
+            for p in TRACKERS
+        ]
+        # nodriver sends a bare <domain>.enable() for every handler domain it
+        # has not seen enabled, on the next send. A pattern-less Fetch.enable
+        # pauses every request at the Request stage, so mark both domains as
+        # enabled before adding the handlers and enable them ourselves.
+        for domain in (cdp.fetch, cdp.network):
+            if domain not in tab.enabled_domains:
+                tab.enabled_domains.append(domain)
+        tab.add_handler(cdp.fetch.RequestPaused, self._on_paused)
+        tab.add_handler(cdp.network.LoadingFinished, self._on_finished)
+        await tab.send(cdp.fetch.enable(patterns=patterns))
+        await tab.send(cdp.network.enable())
+        self._installed.add(id(tab))
+
+    def detach(self, tab):
+        self._installed.discard(id(tab))
+        self._supplier.pop(id(tab), None)
+
+    def _rule(self, tab) -> dict:
+        return RULES.get(self._supplier.get(id(tab)), DEFAULT_RULE)
+
+    async def _on_paused(self, event: cdp.fetch.RequestPaused, tab=None):
+        supplier = self._supplier.get(id(tab))
+        rule = self._rule(tab)
+        url = event.request.url
+        at_response = event.response_status_code is not None or event.response_error_reason is not None
+
+        if at_response:
+            block = event.resource_type.value in rule["types"]
+        else:
+            block = rule["trackers"] and is_tracker(url)
+        if block and any(a in url for a in rule["allow"]):
+            block = False
+
+        try:
+            if not block:
+                if at_response:
+                    await tab.send(cdp.fetch.continue_response(event.request_id))
+                else:
+                    await tab.send(cdp.fetch.continue_request(event.request_id))
+                return
+
+            if at_response:
+                length = next(
+                    (h.value for h in event.response_headers or [] if h.name.lower() == "content-length"), "0"
+                )
+                self._count(supplier, "blocked_bytes", int(length) if length.isdigit() else 0)
+            self._count(supplier, "blocked_requests")
+            await tab.send(cdp.fetch.fail_request(event.request_id, cdp.network.ErrorReason.BLOCKED_BY_CLIENT))
+        except Exception:
+            pass  # the tab navigated away or closed; the request is gone anyway
+
+    def _on_finished(self, event: cdp.network.LoadingFinished, tab=None):
+        supplier = self._supplier.get(id(tab))
+        self._count(supplier, "allowed_requests")
+        self._count(supplier, "allowed_bytes", int(event.encoded_data_length))
+
+    def stats(self) -> dict:
+        return {name: dict(c) for name, c in self.counters.items()}
+
+    def report(self):
+        for name, c in sorted(self.counters.items()):
+            print(
+                f"[Resources] {name}: blocked {c['blocked_requests']} requests / "
+                f"{c['blocked_bytes'] / 1e6:.1f} MB, loaded {c['allowed_requests']} / "
+                f"{c['allowed_bytes'] / 1e6:.1f} MB"
+            )
+
+
+_FILTER: Optional[ResourceFilter] = None
+
+
+def get_resource_filter() -> Optional[ResourceFilter]:
+    """The shared filter, or None when blocking is disabled."""
+    global _FILTER
+    if not BLOCKING_ENABLED:
+        return None
+    if _FILTER is None:
+        _FILTER = ResourceFilter()
+    return _FILTER
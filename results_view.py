@@ -0,0 +1,277 @@
+import asyncio
+import itertools
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+import flet as ft
+
+
+# Rows materialized as widgets at a time
+PAGE_SIZE = 50
+
+# Changes arriving within this window are sent to the client as one update (seconds)
+FLUSH_INTERVAL = 0.15
+
+# (row key, column title); every column but URL sorts
+COLUMNS = [
+    ("supplier", "Supplier"),
+    ("part_number", "Part #"),
+    ("manufacturer", "Manufacturer"),
+    ("stock", "Stock"),
+    ("price", "Price"),
+    ("url", "URL"),
+    ("exact_match", "Exact Match"),
+    ("scraped_sku", "Scraped SKU"),
+]
+UNSORTABLE = {"url"}
+
+# Bold first row above the results on every page
+SECTION_HEADER = "EXACT MATCHES"
+
+# Text the filter box searches
+FILTER_KEYS = ("supplier", "part_number", "manufacturer", "scraped_sku")
+
+
+def _sort_value(row: dict, key: str):
+    """(rank, value): rows of rank 1 (placeholders) stay last whichever way the column sorts."""
+    value = row.get(key)
+    if key in ("stock", "price"):
+        # Numbers, then placeholders such as "N/A - Try Scraping Again"
+        try:
+            return (0, float(value))
+        except (TypeError, ValueError):
+            return (1, str(value))
+    if key == "exact_match":
+        return (0, bool(value))
+    return (0, str(value or "").lower())
+
+
+# ────────────────────────────────
+# Row store
+# ────────────────────────────────
+class ResultStore:
+    """
+    Every result row, plus the sort and filter applied to them.
+
+    Plain dicts only: the widgets for a row exist while it is on the visible
+    page, so a BOM-sized result set costs memory, not controls. The
+    filtered, sorted order is computed lazily and kept until something
+    changes; appends to an unsorted view just extend it.
+    """
+
+    def __init__(self):
+        self.rows: Dict[int, dict] = {}
+        self.sort_key: Optional[str] = None
+        self.ascending = True
+        self.query = ""
+        self.exact_only = False
+        self._ids = itertools.count()
+        self._view: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def clear(self):
+        self.rows.clear()
+        self._view = None
+
+    def extend(self, rows: Iterable[dict]) -> List[int]:
+        added = []
+        for row in rows:
+            row_id = next(self._ids)
+            self.rows[row_id] = row
+            added.append(row_id)
+        if self._view is not None:
+            if self.sort_key is None:
+                self._view.extend(i for i in added if self._matches(self.rows[i]))
+            else:
+                self._view = None
+        return added
+
+    def get(self, row_id: int) -> Optional[dict]:
+        return self.rows.get(row_id)
+
+    def replace(self, row_id: int, row: dict):
+        if row_id in self.rows:
+            self.rows[row_id] = row
+            self._view = None
+
+    def set_sort(self, key: Optional[str], ascending: bool = True):
+        self.sort_key, self.ascending = key, ascending
+        self._view = None
+
+    def set_filter(self, query: str = "", exact_only: bool = False):
+        self.query, self.exact_only = (query or "").strip().lower(), exact_only
+        self._view = None
+
+    def _matches(self, row: dict) -> bool:
+        if self.exact_only and not row.get("exact_match"):
+            return False
+        if not self.query:
+            return True
+        return any(self.query in str(row.get(k) or "").lower() for k in FILTER_KEYS)
+
+    def view(self) -> List[int]:
+        """Row ids that pass the filter, in display order."""
+        if self._view is None:
+            ids = [i for i, row in self.rows.items() if self._matches(row)]
+            if self.sort_key is not None:
+                keys = {i: _sort_value(self.rows[i], self.sort_key) for i in ids}
+                ids.sort(key=keys.__getitem__, reverse=not self.ascending)
+                ids.sort(key=lambda i: keys[i][0])  # stable: keeps the order within each rank
+            self._view = ids
+        return self._view
+
+    def page(self, index: int, size: int) -> List[int]:
+        return self.view()[index * size:(index + 1) * size]
+
+
+# ────────────────────────────────
+# Paged table
+# ────────────────────────────────
+class ResultsView(ft.Column):
+    """
+    Paged results table backed by a ResultStore.
+
+    Only the visible page is built as DataRows (with one Rescrape button
+    each), and `add` does not touch the widgets: changes are coalesced for
+    FLUSH_INTERVAL and then sent as one update of this control instead of
+    a `page.update()` per row. `on_rescrape(row)` returns the replacement
+    row for a Rescrape click.
+    """
+
+    def __init__(
+        self,
+        on_rescrape: Optional[Callable[[dict], Awaitable[dict]]] = None,
+        page_size: int = PAGE_SIZE,
+    ):
+        self.store = ResultStore()
+        self.on_rescrape = on_rescrape
+        self.page_size = page_size
+        self.page_index = 0
+        self._flush_pending = False
+
+        self.table = ft.DataTable(
+            columns=[
+                ft.DataColumn(ft.Text(title), on_sort=None if key in UNSORTABLE else self._on_sort)
+                for key, title in COLUMNS
+            ] + [ft.DataColumn(ft.Text("Action"))],
+            rows=[],
+        )
+        self.filter_input = ft.TextField(label="Filter", width=250, on_change=self._on_filter)
+        self.exact_only = ft.Checkbox(label="Exact matches only", value=False, on_change=self._on_filter)
+        self.prev_button = ft.IconButton(ft.Icons.CHEVRON_LEFT, on_click=lambda e: self.goto(self.page_index - 1))
+        self.next_button = ft.IconButton(ft.Icons.CHEVRON_RIGHT, on_click=lambda e: self.goto(self.page_index + 1))
+        self.page_label = ft.Text("")
+
+        super().__init__(
+            controls=[
+                ft.Row([self.filter_input, self.exact_only, self.prev_button, self.page_label, self.next_button]),
+                ft.ListView(controls=[self.table], expand=True, auto_scroll=False),
+            ],
+            expand=True,
+        )
+        self._render()
+
+    # ---------------------------
+    # Data
+    # ---------------------------
+    def clear(self):
+        self.store.clear()
+        self.page_index = 0
+        self.refresh()
+
+    def add(self, rows: Iterable[dict]):
+        """Queue rows for display; the table catches up on the next flush."""
+        self.store.extend(rows)
+        self.schedule_refresh()
+
+    # ---------------------------
+    # Rendering
+    # ---------------------------
+    def schedule_refresh(self):
+        """Refresh once FLUSH_INTERVAL from now, however many changes arrive meanwhile."""
+        if self.page is None:
+            self._render()
+            return
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.page.run_task(self._flush_later)
+
+    async def _flush_later(self):
+        await asyncio.sleep(FLUSH_INTERVAL)
+        self._flush_pending = False
+        self.refresh()
+
+    def refresh(self):
+        self._render()
+        if self.page is not None:
+            self.update()
+
+    def goto(self, index: int):
+        self.page_index = index
+        self.refresh()
+
+    def _render(self):
+        total = len(self.store.view())
+        pages = max(1, -(-total // self.page_size))
+        self.page_index = min(max(0, self.page_index), pages - 1)
+
+        rows = [self._row(i) for i in self.store.page(self.page_index, self.page_size)]
+        self.table.rows = ([self._header_row(SECTION_HEADER)] if rows else []) + rows
+
+        first = self.page_index * self.page_size
+        label = f"{first + 1 if total else 0}–{first + len(rows)} of {total}"
+        if total != len(self.store):
+            label += f" (filtered from {len(self.store)})"
+        self.page_label.value = label
+        self.prev_button.disabled = self.page_index == 0
+        self.next_button.disabled = self.page_index >= pages - 1
+
+    def _header_row(self, text: str) -> ft.DataRow:
+        return ft.DataRow(
+            cells=[ft.DataCell(ft.Text(text, weight="bold"))] + [ft.DataCell(ft.Text(""))] * len(COLUMNS)
+        )
+
+    def _row(self, row_id: int) -> ft.DataRow:
+        r = self.store.get(row_id)
+        return ft.DataRow(
+            cells=[
+                ft.DataCell(ft.Text(r.get("supplier", ""))),
+                ft.DataCell(ft.Text(r.get("part_number", ""))),
+                ft.DataCell(ft.Text(r.get("manufacturer") or r.get("__manufacturer", ""))),  # else the searched one
+                ft.DataCell(ft.Text(str(r.get("stock", "")))),
+                ft.DataCell(ft.Text(str(r.get("price", "")))),
+                ft.DataCell(ft.TextButton("Open", url=r.get("url", ""))),
+                ft.DataCell(ft.Text("Yes" if r.get("exact_match") else "No")),
+                ft.DataCell(ft.Text(r.get("scraped_sku", ""))),
+                ft.DataCell(ft.ElevatedButton("🔄 Rescrape", data=row_id, on_click=self._on_rescrape)),
+            ]
+        )
+
+    # ---------------------------
+    # Events
+    # ---------------------------
+    def _on_sort(self, e):
+        key = COLUMNS[e.column_index][0]
+        self.store.set_sort(key, e.ascending)
+        self.table.sort_column_index = e.column_index
+        self.table.sort_ascending = e.ascending
+        self.page_index = 0
+        self.refresh()
+
+    def _on_filter(self, e):
+        self.store.set_filter(self.filter_input.value, bool(self.exact_only.value))
+        self.page_index = 0
+        self.schedule_refresh()  # one update per burst of keystrokes
+
+    async def _on_rescrape(self, e):
+        row_id = e.control.data
+        row = self.store.get(row_id)
+        if row is None or self.on_rescrape is None:
+            return
+        e.control.disabled = True
+        e.control.update()
+        try:
+            self.store.replace(row_id, await self.on_rescrape(row))
+        finally:
+            self.refresh()
@@ -0,0 +1,297 @@
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+import aiohttp
+import requests
+from nodriver import cdp
+
+from http_clients import discard_session
+from readiness import wait_ready
+
+
+SESSION_PATH = os.getenv(
+    "RSP_RS_SESSION_PATH",
+    os.path.join(os.path.expanduser("~"), ".rsp_procurement", "rs_session.json"),
+)
+
+# Cookies older than this are re-bootstrapped even without a challenge
+MAX_SESSION_AGE = 12 * 3600
+
+RS_HOME = "https://us.rs-online.com"
+RS_SEARCH_ENDPOINT = f"{RS_HOME}/groupby/search/endpoint"
+
+existing_cookies = {
+    'envMode': 'Live Mode',
+    'form_key': 'dM2rxdGorP9qzaFz',
+    'mage-cache-storage': '{}',
+    'mage-cache-storage-section-invalidation': '{}',
+    'mage-messages': '',
+    'recently_viewed_product': '{}',
+    'recently_viewed_product_previous': '{}',
+    'recently_compared_product': '{}',
+    'recently_compared_product_previous': '{}',
+    'product_data_storage': '{}',
+    'wp_ga4_customerGroup': 'NOT%20LOGGED%20IN',
+    'PHPSESSID': 'ef5dc0c47e68404545c7903771c90e73',
+    # 'section_data_ids': '{...}',  # trimmed for brevity
+    'gbi_visitorId': 'a451fef4d47e9a3801635d232e558590',
+    # 'datadome' will be replaced dynamically
+}
+
+headers = {
+    'accept': 'application/json, text/plain, */*',
+    'accept-language': 'en-US,en;q=0.7',
+    'referer': 'https://us.rs-online.com/catalogsearch/result/?q=schneider+electric',
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36',
+    'x-requested-with': 'XMLHttpRequest',
+    # other headers as needed
+}
+
+
+class RSChallenge(Exception):
+    """The RS search endpoint answered with a DataDome block or captcha."""
+
+
+def is_challenge(status: int, text: str) -> bool:
+    return status == 403 or "captcha-delivery" in (text or "")[:2000]
+
+
+# ────────────────────────────────
+# Bootstrap
+# ────────────────────────────────
+async def get_rs_session_with_datadome(browser, existing_cookies: dict, headers: dict):
+    """
+    Open RS Online in Nodriver, extract ALL browser cookies including DataDome,
+    and load them into a requests.Session with merged cookies.
+    """
+    page = await browser.get(RS_HOME)
+
+    # Wait for the DataDome JS to set its cookie (at most the old fixed 6 s)
+    await wait_ready(page, predicate="document.cookie.includes('datadome=')", timeout=6, required=False)
+
+    # EXTRACT COOKIES (already a list of Cookie objects)
+    raw_cookies = await page.send(cdp.storage.get_cookies())
+
+    session = requests.Session()
+    session.headers.update(headers)
+
+    datadome_value = None
+
+    for c in raw_cookies:
+        name = c.name
+        value = c.value
+        domain = getattr(c, "domain", None)
+
+        # Capture DataDome for later override
+        if name.lower() == "datadome":
+            datadome_value = value
+
+        try:
+            session.cookies.set(name, value, domain=domain)
+        except:
+            session.cookies.set(name, value)
+
+    # Add existing cookies (except datadome)
+    for name, value in existing_cookies.items():
+        if name.lower() != "datadome":
+            session.cookies.set(name, value)
+
+    # Apply datadome last (most important)
+    if datadome_value:
+        session.cookies.set("datadome", datadome_value)
+
+    return session
+
+
+# ────────────────────────────────
+# Shared session
+# ────────────────────────────────
+class RSSessionManager:
+    """
+    Long-lived DataDome cookie set for the RS Online search endpoint.
+
+    The browser round trip happens once; every lookup after that sends the
+    shared cookies through the pooled client from `get_rs_http`. The cookies are written to
+    `path`, so batch workers (separate processes) pick up whatever another
+    worker bootstrapped instead of opening RS themselves. They are only
+    re-bootstrapped when a lookup hits a challenge (see `refresh`) or they are
+    older than `max_age`.
+    """
+
+    def __init__(self, path: str = SESSION_PATH, max_age: float = MAX_SESSION_AGE):
+        self.path = path
+        self.max_age = max_age
+        self.cookies: List[dict] = []
+        self.created_at = 0.0
+        self._lock = asyncio.Lock()
+
+        self.hits = 0
+        self.bootstraps = 0
+        self.refreshes = 0
+        self.challenges = 0
+        self.disk_loads = 0
+
+    @property
+    def age(self) -> Optional[float]:
+        return time.time() - self.created_at if self.cookies else None
+
+    def _expired(self) -> bool:
+        return not self.cookies or self.age > self.max_age
+
+    # ── persistence ──
+    def _load_from_disk(self) -> bool:
+        """Adopt the cookies on disk if they are newer than ours and not expired."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        created_at = data.get("created_at", 0.0)
+        if created_at <= self.created_at or time.time() - created_at > self.max_age:
+            return False
+
+        self.cookies = data.get("cookies", [])
+        self.created_at = created_at
+        self.disk_loads += 1
+        return bool(self.cookies)
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"created_at": self.created_at, "cookies": self.cookies}, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[RS] Could not save session cookies: {e}")
+
+    async def _bootstrap(self, browser):
+        print("[RS] Bootstrapping DataDome session in the browser")
+        session = await get_rs_session_with_datadome(browser, existing_cookies, headers)
+        self.cookies = [
+            {"name": c.name, "value": c.value, "domain": c.domain or ""}
+            for c in session.cookies
+        ]
+        self.created_at = time.time()
+        self._save()
+
+    # ── public API ──
+    def _as_dict(self) -> Dict[str, str]:
+        jar = {c["name"]: c["value"] for c in self.cookies if c["name"].lower() != "datadome"}
+        jar.update({c["name"]: c["value"] for c in self.cookies if c["name"].lower() == "datadome"})
+        return jar
+
+    async def get_cookies(self, browser) -> Dict[str, str]:
+        """The shared cookies as {name: value}, bootstrapping them first if needed."""
+        async with self._lock:
+            if self._expired() and not self._load_from_disk():
+                await self._bootstrap(browser)
+                self.bootstraps += 1
+        self.hits += 1
+        return self._as_dict()
+
+    async def refresh(self, browser, used_created_at: float):
+        """
+        Replace cookies that just got challenged.
+
+        `used_created_at` is the `created_at` of the cookies the failed lookup
+        used; if another lookup (or worker) already refreshed since then, its
+        cookies are reused instead of opening the browser again.
+        """
+        async with self._lock:
+            self.challenges += 1
+            if self.created_at > used_created_at or self._load_from_disk():
+                return
+            await self._bootstrap(browser)
+            self.refreshes += 1
+
+    def absorb(self, rotated: Dict[str, str]):
+        """Keep the cookies the site rotated during a successful lookup (DataDome reissues its cookie)."""
+        changed = False
+        for c in self.cookies:
+            value = rotated.get(c["name"])
+            if value is not None and value != c["value"]:
+                c["value"] = value
+                changed = True
+        if changed:
+            self._save()
+
+    def stats(self) -> dict:
+        age = self.age
+        return {
+            "age": round(age, 1) if age is not None else None,
+            "cookies": len(self.cookies),
+            "hits": self.hits,
+            "bootstraps": self.bootstraps,
+            "refreshes": self.refreshes,
+            "challenges": self.challenges,
+            "disk_loads": self.disk_loads,
+        }
+
+
+_MANAGER: Optional[RSSessionManager] = None
+
+
+def get_rs_session_manager() -> RSSessionManager:
+    global _MANAGER
+    if _MANAGER is None:
+        _MANAGER = RSSessionManager()
+    return _MANAGER
+
+
+# ────────────────────────────────
+# Pooled HTTP client
+# ────────────────────────────────
+_HTTP: Optional[aiohttp.ClientSession] = None
+_HTTP_LOOP = None
+
+
+def get_rs_http() -> aiohttp.ClientSession:
+    """
+    Keep-alive client for the RS search endpoint, shared by every lookup.
+
+    Cookies are not kept in the client: each request passes the manager's
+    cookies, and rotated ones are handed back through `absorb`.
+    """
+    global _HTTP, _HTTP_LOOP
+    loop = asyncio.get_running_loop()
+    if _HTTP is None or _HTTP.closed or _HTTP_LOOP is not loop:
+        discard_session(_HTTP, _HTTP_LOOP)
+        _HTTP_LOOP = loop
+        _HTTP = aiohttp.ClientSession(
+            headers=headers,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=20),
+        )
+    return _HTTP
+
+
+async def close_rs_http():
+    global _HTTP
+    if _HTTP is not None and not _HTTP.closed:
+        await _HTTP.close()
+    _HTTP = None
+
+
+# ────────────────────────────────
+# Manual maintenance
+# ────────────────────────────────
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or drop the shared RS Online session.")
+    parser.add_argument("action", choices=["stats", "clear"])
+    args = parser.parse_args()
+
+    manager = get_rs_session_manager()
+    if args.action == "stats":
+        manager._load_from_disk()
+        print("rs session:", manager.stats())
+    elif os.path.exists(manager.path):
+        os.remove(manager.path)
+        print(f"Removed {manager.path}")
@@ -0,0 +1,300 @@
+import asyncio
+import inspect
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Optional, Union
+
+from models import ProviderResult
+from rate_limit import get_limiter
+from registry import LazyBrowser, TabLease, get_provider, resolve_browser
+from tab_pool import get_tab_pool
+from hedge import hedged
+from cache import cache_key, get_offer_cache, get_miss_cache, is_miss
+from deadline import SEARCH_BUDGET, clear_deadline, deadline, expired, remaining
+
+
+# Cancelled suppliers get this long to release their tabs after the deadline
+CANCEL_GRACE = 2.0
+
+
+@dataclass
+class SupplierOutcome:
+    """Result of one supplier lookup; `error` is set when the scraper raised or ran out of time."""
+    name: str
+    results: List[ProviderResult] = field(default_factory=list)
+    error: Optional[BaseException] = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# ────────────────────────────────
+# Single supplier
+# ────────────────────────────────
+async def run_supplier(name: str, mpn: str, manufacturer: str, browser) -> List[ProviderResult]:
+    """
+    Run one supplier scraper on a tab borrowed from the browser's tab pool.
+
+    nodriver's Tab exposes the same `get(url)` as Browser, so passing the
+    borrowed tab as `browser` keeps every navigation of that scraper on that
+    tab and lets several scrapers drive one Chrome at the same time.
+    Providers that do not need a browser run without one, and a LazyBrowser
+    is only launched here, by the first provider that does. Providers whose
+    fast path needs no Chrome get a TabLease instead of a tab, so Chrome is
+    launched and a tab taken only when that path falls back to the browser.
+
+    The supplier's rate-limit slot is taken before the tab, so lookups queued
+    behind a slow limiter (RS allows one at a time) never hold idle tabs
+    that other suppliers could be using.
+    """
+    spec = get_provider(name)
+    limiter = get_limiter(name)
+
+    async def _attempt(begin):
+        async with limiter.slot():
+            if not spec.needs_browser:
+                begin()
+                return await spec.call(mpn, manufacturer)
+            if spec.tab_on_demand and browser is not None:
+                lease = TabLease(browser, name)
+                try:
+                    begin()
+                    return await spec.call(mpn, manufacturer, browser=lease)
+                finally:
+                    await lease.release()
+            real_browser = await resolve_browser(browser)
+            if real_browser is None:
+                begin()
+                return await spec.call(mpn, manufacturer, browser=None)
+            async with get_tab_pool(real_browser).tab(name) as tab:
+                begin()
+                return await spec.call(mpn, manufacturer, browser=tab)
+
+    def _can_hedge():
+        if not limiter.has_capacity():
+            return False
+        real_browser = browser.browser if isinstance(browser, LazyBrowser) else browser
+        if spec.needs_browser and real_browser is not None:
+            return get_tab_pool(real_browser).has_free()
+        return True
+
+    # A lookup slower than the supplier's p90 gets a second attempt on another tab,
+    # as long as that attempt would not just queue behind the first
+    return await hedged(name, _attempt, can_hedge=_can_hedge)
+
+
+# ────────────────────────────────
+# Cached lookup
+# ────────────────────────────────
+_REFRESHING: Dict[tuple, asyncio.Task] = {}
+
+
+async def _fetch_and_store(name: str, mpn: str, manufacturer: str, browser) -> List[ProviderResult]:
+    results = await run_supplier(name, mpn, manufacturer, browser)
+    if not results:  # empty means the scraper failed; never cache that
+        return results
+
+    if is_miss(results):
+        get_miss_cache().put(name, mpn, results, manufacturer)
+        get_offer_cache().invalidate(name, mpn, manufacturer)
+    else:
+        get_offer_cache().put(name, mpn, results, manufacturer)
+        get_miss_cache().invalidate(name, mpn, manufacturer)
+    return results
+
+
+def _refresh_in_background(name: str, mpn: str, manufacturer: str, browser):
+    """Start one background refresh per (supplier, MPN); later callers reuse it."""
+    key = (name, cache_key(name, mpn, manufacturer))
+    if key in _REFRESHING:
+        return
+
+    async def _refresh():
+        clear_deadline()  # not bound by the search that noticed the stale entry
+        try:
+            await _fetch_and_store(name, mpn, manufacturer, browser)
+        except Exception as e:
+            print(f"[Cache] Background refresh of {name} / {mpn} failed: {e}")
+        finally:
+            _REFRESHING.pop(key, None)
+
+    _REFRESHING[key] = asyncio.create_task(_refresh())
+
+
+async def finish_refreshes(timeout: float = 10.0):
+    """Give background refreshes still running `timeout` seconds, then cancel them (call before shutdown)."""
+    tasks = list(_REFRESHING.values())
+    if not tasks:
+        return
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        print(f"[Cache] Cancelled {len(pending)} background refreshes at shutdown")
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def lookup_supplier(
+    name: str,
+    mpn: str,
+    manufacturer: str,
+    browser,
+    use_cache: bool = True,
+    refresh: bool = False,
+    stale_while_revalidate: bool = True,
+) -> List[ProviderResult]:
+    """
+    run_supplier behind the offer cache.
+
+    Known misses ("not carried" answers) and fresh offers are returned without
+    touching the supplier. Stale offers are returned at once when
+    `stale_while_revalidate` is on, and refreshed in the background.
+    `refresh=True` always scrapes and overwrites the cache entry. Providers
+    that are not `cacheable` always scrape.
+    """
+    use_cache = use_cache and get_provider(name).cacheable
+    if use_cache and not refresh:
+        miss = get_miss_cache().get(name, mpn, manufacturer)
+        if miss is not None:
+            return miss.results
+
+        entry = get_offer_cache().get(name, mpn, manufacturer)
+        if entry is not None:
+            if entry.fresh:
+                return entry.results
+            if stale_while_revalidate:
+                print(f"[Cache] Serving stale {name} / {mpn} ({entry.age / 3600:.1f} h old), refreshing")
+                _refresh_in_background(name, mpn, manufacturer, browser)
+                return entry.results
+
+    if not use_cache:
+        return await run_supplier(name, mpn, manufacturer, browser)
+    return await _fetch_and_store(name, mpn, manufacturer, browser)
+
+
+# ────────────────────────────────
+# Concurrent fan-out
+# ────────────────────────────────
+async def run_concurrent(
+    mpn: str,
+    manufacturer: str,
+    enabled: List[str],
+    browser,
+    on_done: Optional[Callable[[SupplierOutcome], None]] = None,
+    use_cache: bool = True,
+    stale_while_revalidate: bool = True,
+    budget: Optional[float] = SEARCH_BUDGET,
+) -> Dict[str, SupplierOutcome]:
+    """
+    Run every enabled supplier at the same time and collect one outcome per supplier.
+
+    A failing supplier is recorded in its outcome and never cancels the others.
+    `on_done` is called as each supplier finishes (e.g. to update a status line);
+    it may be a coroutine function, and is then awaited. Results come from the
+    offer cache when possible (see lookup_supplier).
+
+    The whole search gets `budget` seconds (see deadline.py): waits inside the
+    scrapers are cut short to fit, and suppliers still running when it runs
+    out are cancelled and come back with `timed_out` set, so the caller gets
+    whatever finished in time.
+    """
+
+    async def _one(name: str) -> SupplierOutcome:
+        try:
+            results = await lookup_supplier(
+                name, mpn, manufacturer, browser,
+                use_cache=use_cache, stale_while_revalidate=stale_while_revalidate,
+            )
+            outcome = SupplierOutcome(name, results or [])
+        except Exception as e:
+            print(f"[ERROR] {name} failed for {mpn}: {e}")
+            outcome = SupplierOutcome(name, error=e, timed_out=expired())
+
+        await _notify(outcome)
+        return outcome
+
+    async def _notify(outcome: SupplierOutcome):
+        if on_done:
+            pending_call = on_done(outcome)
+            if inspect.isawaitable(pending_call):
+                await pending_call
+
+    with deadline(budget):
+        tasks = {asyncio.ensure_future(_one(name)): name for name in enabled}
+        left = remaining()
+
+    if not tasks:
+        return {}
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=left)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+    outcomes = {tasks[t]: t.result() for t in done}
+
+    if pending:
+        for task in pending:
+            task.cancel()
+        await asyncio.wait(pending, timeout=CANCEL_GRACE)
+        for task in pending:
+            name = tasks[task]
+            if task.done() and not task.cancelled():
+                outcomes[name] = task.result()  # finished just as the deadline passed
+                continue
+            print(f"[Search] {name} timed out for {mpn}")
+            outcome = SupplierOutcome(name, error=asyncio.TimeoutError("search deadline passed"), timed_out=True)
+            outcomes[name] = outcome
+            await _notify(outcome)
+
+    return {name: outcomes[name] for name in enabled}
+
+
+# ────────────────────────────────
+# Streaming search
+# ────────────────────────────────
+async def search_stream(
+    mpn: str,
+    manufacturer: str,
+    suppliers: List[str],
+    browser=None,
+    outcomes: bool = False,
+    use_cache: bool = True,
+    budget: Optional[float] = SEARCH_BUDGET,
+    max_buffered: int = 8,
+) -> AsyncIterator[Union[ProviderResult, SupplierOutcome]]:
+    """
+    Yield each ProviderResult as soon as its supplier returns, fastest supplier first.
+
+    With `outcomes=True` one SupplierOutcome is yielded per supplier instead,
+    so a consumer also sees suppliers that found nothing, failed or timed out.
+    At most `max_buffered` finished suppliers wait for the consumer; past that
+    their tasks block until it catches up (and count against the deadline).
+    Leaving the loop early cancels the suppliers still running.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_buffered))
+    producer = asyncio.ensure_future(
+        run_concurrent(mpn, manufacturer, suppliers, browser, on_done=queue.put, use_cache=use_cache, budget=budget)
+    )
+    getter = None
+    try:
+        while not (producer.done() and queue.empty()):
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({getter, producer}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()  # every supplier has reported; drain what is left
+                continue
+            outcome = getter.result()
+            if outcomes:
+                yield outcome
+            else:
+                for result in outcome.results:
+                    yield result
+        producer.result()  # surfaces an orchestrator failure
+    finally:
+        if getter is not None and not getter.done():
+            getter.cancel()
+        if not producer.done():
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
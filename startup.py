@@ -0,0 +1,26 @@
+import sys
+import time
+from typing import List, Tuple
+
+
+# Imported first by the entry points, so this is (close to) process start
+_STARTED = time.perf_counter()
+
+# Modules that make startup slow; the report says which ones are already loaded
+HEAVY_MODULES = ("nodriver", "bs4", "aiohttp", "requests", "dotenv", "pydantic", "flet")
+
+_MARKS: List[Tuple[str, float]] = []
+
+
+def mark(label: str) -> float:
+    """Record that `label` was reached; returns seconds since startup."""
+    elapsed = time.perf_counter() - _STARTED
+    _MARKS.append((label, elapsed))
+    return elapsed
+
+
+def report(prefix: str = "[Startup]"):
+    """One line: every mark so far and the heavy modules loaded by then."""
+    marks = ", ".join(f"{label} {seconds:.2f}s" for label, seconds in _MARKS)
+    loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+    print(f"{prefix} {marks or 'no marks'} (loaded: {', '.join(loaded) or 'none'})")
@@ -0,0 +1 @@
+"""One module per supplier; see providers.py for the lazy facade and registry.py for the wiring."""
@@ -0,0 +1,171 @@
+import re
+from typing import List, Optional
+
+from bs4 import BeautifulSoup
+
+from extract import extract_fields
+from handoff import get_handoff, is_challenge_page
+from matching import matcher_for
+from models import ProviderResult
+from parsing import SCOPES, make_soup
+from rate_limit import report_blocked
+from readiness import wait_ready, wait_settled
+
+
+# ────────────────────────────────
+# Utility Helpers
+# ────────────────────────────────
+
+def parse_price(text: Optional[str]) -> float:
+    """Extract a float from strings like '$7.57'."""
+    if not text:
+        return 0.0
+    try:
+        cleaned = re.sub(r"[^0-9.]", "", text)
+        return float(cleaned) if cleaned else 0.0
+    except Exception:
+        return 0.0
+
+
+def parse_int(text: Optional[str]) -> int:
+    """Extract an integer from text like 'In Stock: 123'."""
+    if not text:
+        return 0
+    try:
+        cleaned = re.sub(r"[^0-9]", "", text)
+        return int(cleaned) if cleaned else 0
+    except Exception:
+        return 0
+
+
+async def get_soup(page, timeout: int = 15000, scroll_attempts: int = 3, scope: Optional[str] = None) -> BeautifulSoup:
+    """
+    Return BeautifulSoup for the current page HTML after ensuring it is loaded.
+    
+    This function:
+      1. Waits until the document has finished parsing (at most `timeout` ms).
+      2. Scrolls to the bottom to trigger lazy-loaded content and waits for the
+         DOM to go quiet (about 100 ms per scroll attempt at most).
+      3. Returns BeautifulSoup of the final page HTML, limited to the
+         containers named by `scope` (see parsing.SCOPES) when given.
+    """
+    await wait_for_page(page, timeout, scroll_attempts)
+    html = await page.get_content()
+    return make_soup(html, scope)
+
+
+async def wait_for_page(page, timeout: int = 15000, scroll_attempts: int = 3):
+    """The loading part of get_soup, for callers that don't need the HTML."""
+    await wait_ready(page, timeout=timeout / 1000, require_loaded=True, required=False)
+
+    if scroll_attempts:
+        await wait_settled(page, quiet_ms=100, timeout=0.1 * scroll_attempts + 0.2)
+
+
+async def read_product_page(page, supplier: str, from_fields, from_soup) -> List[ProviderResult]:
+    """
+    Read a product page through the supplier's in-page extraction spec.
+
+    `from_fields(fields)` builds the results from the small JSON object the
+    browser returns; if extraction is unavailable or fails, the full HTML is
+    parsed with `from_soup(soup)` as before.
+    """
+    await wait_for_page(page)
+
+    fields = await extract_fields(page, supplier)
+    if fields is not None:
+        try:
+            return from_fields(fields)
+        except Exception as e:
+            print(f"[Extract] {supplier} field post-processing failed, parsing HTML: {e}")
+
+    html = await page.get_content()
+    scope = f"{supplier} product"
+    return await from_soup(make_soup(html, scope if scope in SCOPES else None))
+
+
+# ────────────────────────────────
+# Page loading: HTTP cookie handoff, else the browser
+# ────────────────────────────────
+async def fetch_soup(supplier: str, url: str, scope: str, valid: str):
+    """
+    (soup, final url) of `url` fetched over HTTP with the browser's cookies.
+
+    None when the supplier has no fast path yet, it was challenged, or the
+    page lacks the `valid` selector (i.e. is not what the browser would show).
+    """
+    fetcher = get_handoff(supplier)
+    if fetcher is None:
+        return None
+    fetched = await fetcher.fetch(url)
+    if not fetched:
+        return None
+    html, final_url = fetched
+    soup = make_soup(html, scope)
+    if soup.select_one(valid) is None:
+        fetcher.reject()
+        return None
+    return soup, final_url
+
+
+async def report_challenge(supplier: str, page) -> bool:
+    """Tell the supplier's rate limiter when the browser was served a bot challenge instead of the page."""
+    try:
+        head = await page.evaluate("document.documentElement.outerHTML.slice(0, 20000)", return_by_value=True)
+    except Exception:
+        return False
+    if isinstance(head, str) and is_challenge_page(supplier, head):
+        print(f"[{supplier}] Challenge page in the browser")
+        report_blocked("challenge page")
+        return True
+    return False
+
+
+async def harvest_cookies(supplier: str, page):
+    """Hand the cookies of a page the browser rendered to the supplier's HTTP fast path."""
+    fetcher = get_handoff(supplier)
+    if fetcher is not None:
+        await fetcher.harvest(page)
+
+
+async def load_search(supplier: str, url: str, browser, valid: str, ready: str, **wait_kwargs):
+    """
+    Search page soup, over HTTP when possible, otherwise rendered in `browser`.
+
+    Returns (soup, page, final url); `page` is None when HTTP served it.
+    """
+    scope = f"{supplier} search"
+    fetched = await fetch_soup(supplier, url, scope, valid)
+    if fetched:
+        return fetched[0], None, fetched[1]
+
+    page = await browser.get(url)
+    await wait_ready(page, ready, **wait_kwargs)
+    await report_challenge(supplier, page)
+    soup = await get_soup(page, scope=scope)
+    await harvest_cookies(supplier, page)
+    return soup, page, page.url
+
+
+async def load_product(
+    supplier: str, url: str, browser, valid: str, ready: str, from_fields, from_soup, **wait_kwargs
+) -> List[ProviderResult]:
+    """read_product_page, but from HTTP-fetched HTML when the fast path is available."""
+    fetched = await fetch_soup(supplier, url, f"{supplier} product", valid)
+    if fetched:
+        return await from_soup(fetched[0])
+
+    page = await browser.get(url)
+    await wait_ready(page, ready, **wait_kwargs)
+    await report_challenge(supplier, page)
+    results = await read_product_page(page, supplier, from_fields, from_soup)
+    await harvest_cookies(supplier, page)
+    return results
+
+
+# -----------------------------
+# Check if MPN exists in title chunks
+# -----------------------------
+def title_matches_mpn(title: str, mpn: str) -> bool:
+    chunks = [chunk.strip(" ,-/()") for chunk in title.split()]
+    return bool(matcher_for(mpn).exact_tokens(chunks))
@@ -0,0 +1,370 @@
+import asyncio
+import os
+import re
+import traceback
+from typing import List, Optional
+
+import nodriver as uc
+
+from matching import matcher_for
+from models import ProviderResult
+from netcapture import JsonCapture, find_value, key_name, read_next_data, walk_dicts
+from parsing import make_soup
+from rate_limit import rate_limited, report_blocked
+from readiness import wait_ready
+from suppliers.common import get_soup, parse_int, parse_price, read_product_page
+
+
+# ────────────────────────────────
+# Digi-Key Scraper
+# ────────────────────────────────
+async def wait_for_digikey_page(page, mpn, timeout=20):
+    """
+    Waits for Digi-Key product or search page to load, 
+    bypassing the occasional 'access blocked' interstitial.
+    Returns BeautifulSoup of the loaded page.
+    """
+    interval = 1
+    elapsed = 0
+    while elapsed < timeout:
+        html = await page.get_content()
+        soup = make_soup(html, "Digi-Key search")
+
+        # Check for blocker
+        blocker = soup.find("div", class_=re.compile("blocked|captcha|access"))
+        if blocker:
+            print(f"[Digikey] Blocker detected, waiting...")
+            await asyncio.sleep(3)  # wait a few seconds
+            elapsed += 3
+            continue
+
+        # Check for main product container (product detail page)
+        product_header = soup.find("div", {"data-evg": "price-procurement-wrapper"})
+        if product_header:
+            return soup
+
+        # Check for list results page
+        rows = soup.select("div[data-testid='sb-content-container'] tbody tr")
+        if rows:
+            return soup
+
+        # Wait a bit before checking again
+        await asyncio.sleep(interval)
+        elapsed += interval
+
+    # Timeout reached, return whatever is loaded
+    return soup
+
+
+async def parse_digikey_product_page(soup, mpn, url):
+    results = []
+
+    # Find all pricing blocks
+    blocks = soup.find_all("div", {"data-evg": "price-procurement-wrapper"})
+    if not blocks:
+        return []  # pricing never rendered: a failed read, not an answer
+    manufacturer = soup.find("tr", {"data-testid": "overview-manufacturer"})
+    manufacturer_partnumber = soup.find("td", {"data-testid": "mfr-number"})
+    manufacturer_name = manufacturer.text.strip() if manufacturer else None
+    for block in blocks:
+        stock_span = block.find("span", string=lambda t: t and "In-Stock" in t)
+        stock = parse_int(stock_span.text if stock_span else "")
+
+        # Price extraction
+        price_table = block.find("table", class_="MuiTable-root")
+        prices = []
+        if price_table:
+            for td in price_table.select("td.MuiTableCell-body:nth-of-type(2)"):
+                prices.append(parse_price(td.text))
+
+        price = min(prices) if prices else 0.0
+
+        results.append(
+            ProviderResult(
+                supplier="DigiKey",
+                part_number=mpn,
+                manufacturer=manufacturer_name,
+                stock=stock,
+                price=price,
+                url=url,
+                exact_match=True,
+                scraped_sku=manufacturer_partnumber.text.strip() if manufacturer_partnumber else None
+            )
+        )
+
+    return results
+
+
+def digikey_results_from_fields(fields, mpn, url) -> List[ProviderResult]:
+    """parse_digikey_product_page on top of the "Digi-Key" extraction spec."""
+    blocks = fields["blocks"]
+    if not blocks:
+        return []  # pricing never rendered: a failed read, not an answer
+    manufacturer = fields["page"]["manufacturer"]
+    manufacturer_partnumber = fields["page"]["scraped_sku"]
+
+    results = []
+    for block in blocks:
+        prices = [parse_price(p) for p in block["prices"]]
+        results.append(
+            ProviderResult(
+                supplier="DigiKey",
+                part_number=mpn,
+                manufacturer=manufacturer.strip() if manufacturer is not None else None,
+                stock=parse_int(block["stock"] or ""),
+                price=min(prices) if prices else 0.0,
+                url=url,
+                exact_match=True,
+                scraped_sku=manufacturer_partnumber.strip() if manufacturer_partnumber is not None else None
+            )
+        )
+    return results
+
+
+# ────────────────────────────────
+# Digi-Key network capture
+# ────────────────────────────────
+# Digi-Key's pages fetch (or embed, via __NEXT_DATA__) pricing and stock as
+# JSON. In capture mode those bodies are read straight off the CDP Network
+# domain and the scraper returns as soon as one of them holds the part,
+# before anything renders. The key names are matched loosely, so a renamed
+# field degrades to the DOM scraper instead of wrong data. Opt-in with
+# RSP_DIGIKEY_CAPTURE=1 until it has been checked against the DOM output on
+# more parts.
+DIGIKEY_CAPTURE = os.getenv("RSP_DIGIKEY_CAPTURE", "0") == "1"
+DIGIKEY_JSON_URL = r"digikey\.com/"
+DIGIKEY_SEARCH_READY = (
+    "div[data-evg='price-procurement-wrapper'], div[data-testid='category-exact-match'], "
+    "div[data-testid='sb-content-container'] tbody tr, [class*='noResultsText'], "
+    "div[class*='blocked'], div[class*='captcha']"
+)
+
+_DK_MPN_KEYS = {"manufacturerproductnumber", "manufacturerpartnumber", "mfrpartnumber", "mfrproductnumber"}
+_DK_STOCK_KEYS = {"quantityavailable", "qtyavailable", "quantityonhand", "availablequantity"}
+_DK_PRICE_KEYS = {"unitprice", "breakprice", "priceperunit"}
+_DK_BREAKS_KEYS = {"standardpricing", "pricebreaks", "pricing", "myprice"}
+_DK_MANUFACTURER_KEYS = {"manufacturer", "manufacturername"}
+_DK_URL_KEYS = {"producturl", "detailurl", "productdetailurl"}
+
+
+def _own_value(node: dict, keys: set):
+    """Scalar stored directly on `node` under one of `keys` (not in a nested object)."""
+    return next(
+        (v for k, v in node.items()
+         if key_name(k) in keys and isinstance(v, (int, float, str)) and not isinstance(v, bool)),
+        None,
+    )
+
+
+def _variant_breaks(node: dict) -> Optional[list]:
+    """Unit prices of `node`'s own price-break table, or None when it has none."""
+    for k, v in node.items():
+        if key_name(k) in _DK_BREAKS_KEYS and isinstance(v, list):
+            prices = [_own_value(b, _DK_PRICE_KEYS) for b in v if isinstance(b, dict)]
+            return [p for p in (parse_price(str(p)) for p in prices if p is not None) if p > 0]
+    return None
+
+
+def _is_variant(node: dict) -> bool:
+    """A packaging entry (cut tape, reel, ...): its own stock figure or its own price breaks."""
+    return _own_value(node, _DK_STOCK_KEYS) is not None or _variant_breaks(node) is not None
+
+
+def digikey_results_from_json(data, mpn: str, url: str) -> Optional[List[ProviderResult]]:
+    """
+    Offers for `mpn` in a Digi-Key JSON document, or None if it has none.
+
+    Like parse_digikey_product_page, there is one result per packaging
+    variant, priced at the lowest unit price of that variant's own breaks.
+    A product that lists variants gets one result per variant, not one for
+    the product as a whole.
+    """
+    matcher = matcher_for(mpn)
+    matched = []
+    for node in walk_dicts(data):
+        scraped_sku = _own_value(node, _DK_MPN_KEYS)
+        if isinstance(scraped_sku, str) and matcher.exact(scraped_sku):
+            matched.append((node, scraped_sku.strip()))
+
+    # Overview fields are often in a sibling object of the pricing one
+    manufacturer = next((m for m in (find_value(n, _DK_MANUFACTURER_KEYS) for n, _ in matched) if m), None)
+    if isinstance(manufacturer, dict):
+        manufacturer = _own_value(manufacturer, {"name", "value"})
+
+    results, seen = [], set()
+    for node, scraped_sku in matched:
+        product_url = find_value(node, _DK_URL_KEYS)
+        if isinstance(product_url, str) and product_url.startswith("/"):
+            product_url = "https://www.digikey.com" + product_url
+
+        variants = [n for n in walk_dicts(node) if _is_variant(n)]
+        # Only the innermost entries: a product's total stock is not an offer of its own
+        leaves = [
+            v for v in variants
+            if not any(other is not v and _is_variant(other) for other in list(walk_dicts(v))[1:])
+        ]
+        for variant in leaves:
+            if id(variant) in seen:
+                continue  # the same entry under a nested match
+            seen.add(id(variant))
+
+            stock = _own_value(variant, _DK_STOCK_KEYS)
+            prices = _variant_breaks(variant)
+            if prices is None:
+                price = _own_value(variant, _DK_PRICE_KEYS)
+                prices = [p for p in [parse_price(str(price))] if p > 0] if price is not None else []
+
+            results.append(
+                ProviderResult(
+                    supplier="DigiKey",
+                    part_number=mpn,
+                    manufacturer=manufacturer if isinstance(manufacturer, str) else None,
+                    stock=parse_int(str(stock)) if stock is not None else 0,
+                    price=min(prices) if prices else 0.0,
+                    url=product_url if isinstance(product_url, str) else url,
+                    exact_match=True,
+                    scraped_sku=scraped_sku
+                )
+            )
+    return results or None
+
+
+async def capture_digikey(tab, mpn: str, search_url: str) -> Optional[List[ProviderResult]]:
+    """
+    Load the search page on `tab` and build results from Digi-Key's JSON.
+
+    Races the captured responses against the page rendering; if the DOM is
+    ready first, the embedded __NEXT_DATA__ is tried before giving up. The
+    tab is left on the search page, so the DOM scraper can carry on from there.
+    """
+    pick = lambda body: digikey_results_from_json(body, mpn, search_url)
+
+    async with JsonCapture(tab, DIGIKEY_JSON_URL) as capture:
+        await tab.get(search_url)
+        captured = asyncio.ensure_future(capture.first(pick, timeout=15))
+        rendered = asyncio.ensure_future(wait_ready(tab, DIGIKEY_SEARCH_READY, timeout=15, required=False))
+        try:
+            await asyncio.wait({captured, rendered}, return_when=asyncio.FIRST_COMPLETED)
+            if captured.done() and captured.result():
+                print(f"[Digikey] {mpn}: offers from captured JSON ({capture.seen} bodies)")
+                return captured.result()
+        finally:
+            captured.cancel()
+            rendered.cancel()
+
+    results = pick(await read_next_data(tab))
+    if results:
+        print(f"[Digikey] {mpn}: offers from __NEXT_DATA__")
+    return results
+
+
+@rate_limited("Digi-Key")
+async def scrape_digikey(mpn: str, browser) -> List[ProviderResult]:
+    base_url = "https://www.digikey.com"
+    search_url = f"{base_url}/en/products/result?keywords={mpn}"
+
+    # browser, own_browser = await get_or_create_browser(browser)
+    results = []
+
+    try:
+        # ---------------------------
+        # LOAD SEARCH PAGE
+        # ---------------------------
+        if DIGIKEY_CAPTURE and isinstance(browser, uc.Tab):
+            captured = await capture_digikey(browser, mpn, search_url)
+            if captured:
+                return captured
+            page = browser  # already on the search page
+        else:
+            page = await browser.get(search_url)
+        await wait_ready(page, DIGIKEY_SEARCH_READY, timeout=15, required=False)
+        soup = await get_soup(page, scope="Digi-Key search")
+        blocker = soup.find("div", class_=re.compile("blocked|captcha|access"))
+        if blocker:
+            print(f"[Digikey] Blocker detected, waiting...")
+            report_blocked("blocker page")
+            await asyncio.sleep(2)
+        # soup = await wait_for_digikey_page(page, mpn, timeout=20)
+
+        # ---------------------------
+        # CASE 1: DIRECT PRODUCT PAGE
+        # ---------------------------
+        # If we are already on a product page, Digi-Key prints the MPN in a data attribute.
+        # Check if we are on a detail page
+        product_header = soup.find("div", {"data-evg": "price-procurement-wrapper"})
+        if product_header:
+            return await parse_digikey_product_page(soup, mpn, search_url)
+
+        # ---------------------------
+        # CASE 2: EXACT MATCH BANNER
+        # ---------------------------
+        exact_match_block = soup.find("div", {"data-testid": "category-exact-match"})
+        if exact_match_block:
+            link = exact_match_block.find("a", href=True)
+            if link:
+                url = base_url + link["href"]
+                page = await browser.get(url)
+                await wait_ready(page, "div[data-evg='price-procurement-wrapper']", timeout=10)
+                return await read_product_page(
+                    page, "Digi-Key",
+                    lambda fields: digikey_results_from_fields(fields, mpn, url),
+                    lambda soup: parse_digikey_product_page(soup, mpn, url),
+                )
+
+        # ---------------------------
+        # CASE 3: LIST PAGE (multiple rows)
+        # ---------------------------
+        rows = soup.select("div[data-testid='sb-content-container'] tbody tr")
+        if rows:
+            matcher = matcher_for(mpn)
+            for row in rows:
+                sku_block = row.find("div", class_=re.compile("mfrProdNumHeader"))
+                if not sku_block:
+                    continue
+
+                scraped_sku = sku_block.get_text(strip=True)
+
+                # Found an exact part in the list
+                # mpn= "ST201M-C5"
+                if matcher.exact(scraped_sku):
+                    link = sku_block.find("a", href=True)
+                    if link:
+                        url = base_url + link["href"]
+
+                        page = await browser.get(url)
+                        await wait_ready(
+                            page, "div[data-evg='price-procurement-wrapper'] table", timeout=15, required=False
+                        )
+                        return await read_product_page(
+                            page, "Digi-Key",
+                            lambda fields: digikey_results_from_fields(fields, mpn, url),
+                            lambda soup: parse_digikey_product_page(soup, mpn, url),
+                        )
+
+        # ---------------------------
+        # NOTHING FOUND
+        # ---------------------------
+        # Check if no results message is present for classname with tet inside: -noResultsText
+        no_results = soup.find(class_=re.compile("noResultsText"))
+        if no_results:
+            results.append(
+                ProviderResult(
+                    supplier="DigiKey",
+                    part_number=mpn,
+                    manufacturer="N/A",
+                    stock=0,
+                    price=0.0,
+                    url="Not Found",
+                    exact_match=False,
+                    not_carried=True,
+                )
+            )
+        return results
+
+    except Exception as e:
+        print(f"[ERROR] DigiKey {mpn}: {e}")
+        traceback.print_exc()
+        return []
+
+    finally:
+        pass
@@ -0,0 +1,225 @@
+import asyncio
+import functools
+import os
+import re
+from typing import Dict, List, Optional
+
+from ebay import get_ebay_client
+from matching import TOKEN_RE, MpnMatcher, matcher_for
+from models import ProviderResult
+from rate_limit import rate_limited
+
+
+# ────────────────────────────────
+# eBay API Scraper (FULL ASYNC)
+# ────────────────────────────────
+@functools.lru_cache(maxsize=1)
+def ebay_credentials():
+    """(CLIENT_ID, CLIENT_SECRET) from the environment or .env, read on the first eBay lookup."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return os.getenv("CLIENT_ID"), os.getenv("CLIENT_SECRET")
+
+
+def extract_sku_tokens(title: str):
+    return TOKEN_RE.findall(title)
+
+
+EBAY_FILTER = "conditionIds:{1000},itemLocationCountry:US"
+
+
+def ebay_item_passes(item: dict) -> bool:
+    """Listing filters shared by single and batched searches."""
+    # must have image
+    if not item.get("image", {}).get("imageUrl"):
+        return False
+
+    # seller feedback ≥ 90%
+    feedback = float(item.get("seller", {}).get("feedbackPercentage", 0))
+    if feedback < 90:
+        return False
+
+    # returns accepted
+    if item.get("returnTerms", {}).get("returnsAccepted") is False:
+        return False
+    return True
+
+
+def ebay_result(item: dict, mpn: str, scraped_sku, exact_match: bool) -> ProviderResult:
+    return ProviderResult(
+        supplier="eBay",
+        part_number=mpn,
+        manufacturer=None,
+        stock=0,
+        price=float(item.get("price", {}).get("value", 0.0)),
+        url=item.get("itemWebUrl", ""),
+        exact_match=exact_match,
+        scraped_sku=scraped_sku   # NEW FIELD
+    )
+
+
+@rate_limited("eBay")
+async def scrape_ebay(mpn: str, browser =None) -> List[ProviderResult]:
+    if _EBAY_BATCHER is not None and ebay_batchable(mpn):
+        return await _EBAY_BATCHER.lookup(mpn)
+
+    print(f"🔍 Searching eBay for {mpn}...")
+
+    params = {
+        "q": f'"{mpn}"',
+        "limit": "50",
+        "filter": EBAY_FILTER
+    }
+
+    # Shared pooled client; the OAuth token is refreshed once for all lookups
+    data = await get_ebay_client(*ebay_credentials()).search(params)
+
+    items = data.get("itemSummaries", [])
+    results = []
+    matcher = matcher_for(mpn)
+
+    for item in items:
+        title = item.get("title", "")
+        if not title:
+            continue
+
+        # first SKU token containing the MPN
+        hit = matcher.scan(title).get(mpn)
+
+        if not ebay_item_passes(item):
+            continue
+
+        results.append(ebay_result(item, mpn, hit.token if hit else None, bool(hit and hit.exact)))
+
+    print(f"✅ eBay done: {len(results)} results, :result 1: {results[0] if results else 'N/A'}")
+    return results
+
+
+# ────────────────────────────────
+# eBay batched search
+# ────────────────────────────────
+EBAY_QUERY_MAX = 100      # Browse API limit on the length of q
+EBAY_BATCH_PAGE = 200     # largest page the Browse API returns
+EBAY_BATCH_MAX_PAGES = 5
+
+
+def ebay_batchable(mpn: str) -> bool:
+    """MPNs containing OR-query syntax are searched on their own."""
+    return not re.search(r'[(),"]', mpn) and len(mpn) + 4 <= EBAY_QUERY_MAX
+
+
+def pack_ebay_queries(mpns: List[str]) -> List[List[str]]:
+    """Group MPNs into OR queries ("A", "B", ...) that fit in EBAY_QUERY_MAX characters."""
+    groups, current, length = [], [], 2
+    for mpn in mpns:
+        cost = len(mpn) + 2 + (2 if current else 0)  # quotes, plus ", " separator
+        if current and length + cost > EBAY_QUERY_MAX:
+            groups.append(current)
+            current, length = [], 2
+            cost = len(mpn) + 2
+        current.append(mpn)
+        length += cost
+    if current:
+        groups.append(current)
+    return groups
+
+
+async def search_ebay_many(mpns: List[str]) -> Dict[str, List[ProviderResult]]:
+    """
+    One OR search for several MPNs, paginated, split back per MPN.
+
+    An item goes to every MPN one of its title tokens contains. scrape_ebay
+    also keeps the listings that match no token (scraped_sku None, not
+    exact); a batch of one MPN does the same, but in a batch of several
+    there is no telling whose they are, so they are dropped. The listing
+    filters are the same as for single searches.
+    """
+    client = get_ebay_client(*ebay_credentials())
+    query = "(" + ", ".join(f'"{m}"' for m in mpns) + ")"
+    print(f"🔍 Searching eBay for {len(mpns)} MPNs: {query}")
+
+    items = []
+    for page in range(EBAY_BATCH_MAX_PAGES):
+        data = await client.search({
+            "q": query,
+            "limit": str(EBAY_BATCH_PAGE),
+            "offset": str(page * EBAY_BATCH_PAGE),
+            "filter": EBAY_FILTER,
+        })
+        batch = data.get("itemSummaries", [])
+        items.extend(batch)
+        if len(batch) < EBAY_BATCH_PAGE or len(items) >= data.get("total", 0):
+            break
+
+    matcher = MpnMatcher(mpns)
+    results: Dict[str, List[ProviderResult]] = {m: [] for m in mpns}
+    for item in items:
+        title = item.get("title", "")
+        if not title or not ebay_item_passes(item):
+            continue
+
+        hits = matcher.scan(title)
+        if not hits and len(mpns) == 1:
+            results[mpns[0]].append(ebay_result(item, mpns[0], None, False))
+        for mpn, hit in hits.items():
+            results[mpn].append(ebay_result(item, mpn, hit.token, hit.exact))
+
+    print(f"✅ eBay batch done: {len(items)} listings for {len(mpns)} MPNs")
+    return results
+
+
+class EbayBatcher:
+    """
+    Micro-batches concurrent scrape_ebay calls into OR queries.
+
+    Lookups arriving within `window` seconds of each other share one search
+    (split further when the query would get too long), which is what saves
+    API quota on bulk runs where many rows are in flight at once.
+    """
+
+    def __init__(self, window: float = 0.05):
+        self.window = window
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._timer = None
+        self.searches = 0
+        self.lookups = 0
+
+    async def lookup(self, mpn: str) -> List[ProviderResult]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(mpn, []).append(future)
+        self.lookups += 1
+        if self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        pending, self._pending, self._timer = self._pending, {}, None
+        for group in pack_ebay_queries(list(pending)):
+            asyncio.ensure_future(self._run(group, {m: pending[m] for m in group}))
+
+    async def _run(self, group: List[str], waiters: Dict[str, List[asyncio.Future]]):
+        self.searches += 1
+        try:
+            results = await search_ebay_many(group)
+        except Exception as e:
+            for futures in waiters.values():
+                for f in futures:
+                    if not f.done():
+                        f.set_exception(e)
+            return
+        for mpn, futures in waiters.items():
+            for f in futures:
+                if not f.done():
+                    f.set_result(list(results.get(mpn, [])))
+
+
+_EBAY_BATCHER: Optional[EbayBatcher] = None
+
+
+def enable_ebay_batching(window: float = 0.05) -> EbayBatcher:
+    """Route scrape_ebay through an EbayBatcher (used by batch runs)."""
+    global _EBAY_BATCHER
+    _EBAY_BATCHER = EbayBatcher(window)
+    return _EBAY_BATCHER
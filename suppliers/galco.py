@@ -0,0 +1,160 @@
+import traceback
+from typing import List
+
+from matching import matcher_for
+from models import ProviderResult
+from rate_limit import rate_limited
+from suppliers.common import load_product, load_search, parse_int, parse_price
+
+
+# ────────────────────────────────
+# Galco Scraper
+# ────────────────────────────────
+# Selectors an HTTP-fetched page must contain to be used instead of the browser
+GALCO_SEARCH_VALID = "div.no-results, div.product-info-main, div.product.main-details"
+GALCO_PRODUCT_VALID = "div[itemprop='MFG Item Number'], span.price"
+
+
+@rate_limited("Galco")
+async def scrape_galco(mpn: str, brand: str, browser, _retry=False) -> List[ProviderResult]:
+    base_url = "https://www.galco.com"
+    search_url = f"{base_url}/catalogsearch/result/?q={mpn}"
+
+    # browser, own_browser = await get_or_create_browser(browser)
+    results = []
+
+    try:
+        # ---------------------------
+        # LOAD SEARCH PAGE
+        # ---------------------------
+        soup, page, page_url = await load_search(
+            "Galco", search_url, browser, GALCO_SEARCH_VALID, "nav.navigation", timeout=10, require_loaded=True
+        )
+
+        # ---------------------------
+        # CASE 1: NO RESULTS
+        # ---------------------------
+        if soup.find("div", class_="no-results"):
+            return [
+                ProviderResult(
+                    supplier="Galco",
+                    part_number=mpn,
+                    manufacturer="N/A",
+                    stock=0,
+                    price=0.0,
+                    url="Not Found",
+                    exact_match=False,
+                    not_carried=True
+                )
+            ]
+
+        # ---------------------------
+        # CASE 2: PRODUCT PAGE DIRECT (single product)
+        # ---------------------------
+        if soup.find("div", class_="product-info-main"):  # Galco product pages have this
+            return await parse_galco_product_page(soup, mpn, brand, page_url)
+
+        # ---------------------------
+        # CASE 3: SEARCH RESULTS LIST
+        # ---------------------------
+        product_cards = soup.find_all("div", class_="product main-details")
+        # if it product_cards is empty
+        
+        if product_cards == [] and  not _retry:
+            print(f"[Galco] No results for {mpn}, RETRYING...")
+            return await scrape_galco(mpn, brand, browser, _retry=True)
+
+        if not product_cards:
+            # Neither results nor Galco's "no results" block even after retrying: the page didn't render
+            return []
+
+        # Look for matching MPN in the results
+        matcher = matcher_for(mpn)
+        for card in product_cards:
+            brand_el = card.find("div", class_="product attribute brand")
+            scraped_brand = brand_el.text.strip() if brand_el else ""
+
+            mpn_tag = card.find("div", class_="mfg-item-number")
+            scraped_mpn = (
+                mpn_tag.find("div", class_="value").get_text(strip=True)
+                if mpn_tag else ""
+            )
+
+            if matcher.exact(scraped_mpn):
+                # Navigate into product page
+                link = card.find("a", class_="product-item-link", href=True)
+                if link:
+                    product_url = base_url + link["href"]
+                    return await load_product(
+                        "Galco", product_url, browser, GALCO_PRODUCT_VALID, "div.product-info-main",
+                        lambda fields: galco_results_from_fields(fields, mpn, scraped_brand, product_url),
+                        lambda soup: parse_galco_product_page(soup, mpn, scraped_brand, product_url),
+                        timeout=10, require_loaded=True, required=False,
+                    )
+
+        # ---------------------------
+        # CASE 4: MPN NOT FOUND IN LIST
+        # ---------------------------
+        return [
+            ProviderResult(
+                supplier="Galco",
+                part_number=mpn,
+                manufacturer="N/A",
+                stock=0,
+                price=0.0,
+                url=search_url,
+                exact_match=False,
+            )
+        ]
+
+    except Exception as e:
+        print(f"[ERROR] Galco exception for {mpn}: {e}")
+        traceback.print_exc()
+        return []
+
+    finally:
+        pass
+
+async def parse_galco_product_page(soup, mpn, brand, url):
+    results = []
+    # manufacturer part number
+    # itemprop="MFG Item Number"
+    manufacturer_partnumber_el = soup.find("div", itemprop="MFG Item Number")
+
+    # Stock
+    stock_el = soup.select_one("span.stock-number")
+    stock = parse_int(stock_el.text if stock_el else "")
+
+    # Price
+    price_el = soup.select_one("span.price")
+    price = parse_price(price_el.text if price_el else "")
+
+    return [
+        ProviderResult(
+            supplier="Galco",
+            part_number=mpn,
+            manufacturer=brand,
+            stock=stock,
+            price=price,
+            url=url,
+            exact_match=True,
+            scraped_sku=manufacturer_partnumber_el.text.strip() if manufacturer_partnumber_el else None
+        )
+    ]
+
+
+def galco_results_from_fields(fields, mpn, brand, url) -> List[ProviderResult]:
+    """parse_galco_product_page on top of the "Galco" extraction spec."""
+    page = fields["page"]
+    return [
+        ProviderResult(
+            supplier="Galco",
+            part_number=mpn,
+            manufacturer=brand,
+            stock=parse_int(page["stock"] or ""),
+            price=parse_price(page["price"] or ""),
+            url=url,
+            exact_match=True,
+            scraped_sku=page["scraped_sku"].strip() if page["scraped_sku"] is not None else None
+        )
+    ]
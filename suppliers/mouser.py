@@ -0,0 +1,197 @@
+import re
+import traceback
+from typing import List
+
+from chrome import get_or_create_browser
+from matching import matcher_for
+from models import ProviderResult
+from rate_limit import rate_limited
+from readiness import wait_ready
+from suppliers.common import get_soup, load_product, load_search, parse_int, parse_price, report_challenge
+
+
+# ────────────────────────────────
+# Mouser Scraper
+# ────────────────────────────────
+MOUSER_SEARCH_VALID = "div#pdpPricingAvailability, tr[data-partnumber], div.no-results-heading"
+MOUSER_PRODUCT_VALID = "span#spnManufacturerPartNumber, h2[data-testid='PricingAvailabilityHeader']"
+
+
+@rate_limited("Mouser")
+async def scrape_mouser(mpn: str, browser=None, wait_per_try: int = 5) -> List[ProviderResult]:
+    search_url = f"https://www.mouser.com/c/?q={mpn}"
+    print(f"🔍 Searching Mouser for: {mpn}")
+
+    browser, own_browser = await get_or_create_browser(browser)
+    results = []
+
+    try:
+        # ---------------------------
+        # LOAD SEARCH PAGE
+        # ---------------------------
+        soup, page, page_url = await load_search(
+            "Mouser", search_url, browser, MOUSER_SEARCH_VALID, MOUSER_SEARCH_VALID, timeout=10
+        )
+
+        # ---------------------------
+        # CASE 1: DIRECT PRODUCT PAGE
+        # ---------------------------
+        if soup.find("div", id="pdpPricingAvailability"):
+            return await parse_mouser_product_page(soup, mpn, search_url)
+
+        # ---------------------------
+        # CASE 2: SEARCH RESULTS LIST
+        # ---------------------------
+        rows = soup.find_all("tr", attrs={"data-partnumber": True})
+
+        if not rows and page is not None:
+            # Retry once in the browser (HTTP pages were already validated)
+            await page.reload()
+            await wait_ready(page, MOUSER_SEARCH_VALID, timeout=10)
+            await report_challenge("Mouser", page)
+            soup = await get_soup(page, scope="Mouser search")
+            rows = soup.find_all("tr", attrs={"data-partnumber": True})
+
+        if not rows:
+            if not soup.find("div", class_="no-results-heading"):
+                return []  # the results never rendered; don't report it as not carried
+            return [
+                ProviderResult(
+                    supplier="Mouser",
+                    part_number=mpn,
+                    manufacturer="N/A",
+                    stock=0,
+                    price=0.0,
+                    url="Not Found",
+                    exact_match=False,
+                    not_carried=True
+                )
+            ]
+
+        # ---------------------------
+        # FIND EXACT MATCH IN LIST PAGE
+        # ---------------------------
+        matcher = matcher_for(mpn)
+        for row in rows:
+            sku_tag = row.find("div", class_="mfr-part-num")
+            if not sku_tag:
+                continue
+
+            scraped_sku = sku_tag.get_text(strip=True).lower()
+            # remove mfr. part # prefix if present
+            scraped_sku = re.sub(r"^mfr\. part #\s*", "", scraped_sku)
+
+            if not matcher.exact(scraped_sku):
+                continue
+
+            # Found exact match — parse table
+            # find the link and send to be extracted
+            link_tag = sku_tag.find("a", href=True) 
+            product_url = link_tag["href"] if link_tag else search_url
+            if not product_url.startswith("http"):
+                product_url = "https://www.mouser.com" + product_url
+            return await load_product(
+                "Mouser", product_url, browser, MOUSER_PRODUCT_VALID, "div#pdpPricingAvailability, tr[data-partnumber]",
+                lambda fields: mouser_results_from_fields(fields, mpn, product_url),
+                lambda soup: parse_mouser_product_page(soup, mpn, product_url),
+                timeout=10,
+            )
+        
+        return [
+            ProviderResult(
+                supplier="Mouser",
+                part_number=mpn,
+                manufacturer=None,
+                stock=0,
+                price=0.0,
+                url=search_url,
+                exact_match=False,
+            )
+        ]
+
+    except Exception as e:
+        print(f"[ERROR] Mouser exception for {mpn}: {e}")
+        traceback.print_exc()
+        return []
+
+    finally:
+        if own_browser:
+            browser.stop()
+
+async def parse_mouser_product_page(soup, mpn, url):
+    # Restricted availability?
+    restricted_el = soup.find(attrs={"data-testid": "RestrictedAvailabilityTrigger"})
+    if restricted_el and "Restricted Availability" in restricted_el.text:
+        return [
+            ProviderResult(
+                supplier="Mouser",
+                part_number=mpn,
+                manufacturer="N/A",
+                stock=0,
+                price=0.0,
+                url="Not Found",
+                exact_match=False,
+            )
+        ]
+
+    # Extract SKU
+    # Manufacturer
+    # id = lnkManufacturerName
+    manufacturer_el = soup.find("a", id="lnkManufacturerName")
+    manufacturer = manufacturer_el.get_text(strip=True) if manufacturer_el else None
+    sku_el = soup.find("span", id="spnManufacturerPartNumber")
+    scraped_sku = sku_el.get_text(strip=True) if sku_el else ""
+
+    exact_match = bool(matcher_for(mpn).exact(scraped_sku))
+
+    # Stock
+    stock_el = soup.find("h2", {"data-testid": "PricingAvailabilityHeader"})
+    stock = parse_int(stock_el.text if stock_el else "")
+
+    # Price (first price break row)
+    row = soup.find("tr", {"data-testid": "PricingTablePriceBreakRow"})
+    price = parse_price(row.find_all("td")[0].text if row else "")
+
+    return [
+        ProviderResult(
+            supplier="Mouser",
+            part_number=scraped_sku or mpn,
+            manufacturer=manufacturer,
+            stock=stock,
+            price=price,
+            url=url,
+            exact_match=exact_match,
+            scraped_sku=scraped_sku
+        )
+    ]
+
+
+def mouser_results_from_fields(fields, mpn, url) -> List[ProviderResult]:
+    """parse_mouser_product_page on top of the "Mouser" extraction spec."""
+    page = fields["page"]
+    if page["restricted"] and "Restricted Availability" in page["restricted"]:
+        return [
+            ProviderResult(
+                supplier="Mouser",
+                part_number=mpn,
+                manufacturer="N/A",
+                stock=0,
+                price=0.0,
+                url="Not Found",
+                exact_match=False,
+            )
+        ]
+
+    scraped_sku = page["scraped_sku"] or ""
+    return [
+        ProviderResult(
+            supplier="Mouser",
+            part_number=scraped_sku or mpn,
+            manufacturer=page["manufacturer"],
+            stock=parse_int(page["stock"] or ""),
+            price=parse_price(page["price"] or ""),
+            url=url,
+            exact_match=bool(matcher_for(mpn).exact(scraped_sku)),
+            scraped_sku=scraped_sku
+        )
+    ]
@@ -0,0 +1,248 @@
+import re
+import traceback
+from typing import List
+
+from chrome import get_or_create_browser
+from matching import matcher_for
+from models import ProviderResult
+from rate_limit import rate_limited
+from readiness import wait_ready
+from suppliers.common import get_soup, load_product, load_search, parse_int, parse_price, report_challenge
+
+
+# ───────────────────────────────
+# Radwell Scraper
+# ───────────────────────────────
+RADWELL_SEARCH_VALID = "div.rd-buyOpts, #searchResults"
+RADWELL_PRODUCT_VALID = "span.pdp-part-number, div.option"
+
+# Radwell's own wording for a search with no hits, read from #searchResults
+_NO_RESULTS = r"\bno (results|matches|products)\b|\b0 (results|matches)\b"
+RADWELL_NO_RESULTS = re.compile(_NO_RESULTS, re.I)
+
+# The results container is there before its tiles: wait for tiles or the no-results text
+RADWELL_ANSWERED_JS = (
+    "document.querySelector('#searchResults a.taglink') || "
+    f"/{_NO_RESULTS}/i.test((document.querySelector('#searchResults') || {{}}).innerText || '')"
+)
+
+
+@rate_limited("Radwell")
+async def scrape_radwell(mpn: str, browser=None, wait_per_try: int = 5) -> List[ProviderResult]:
+    base_url = "https://www.radwell.com"
+    search_url = f"{base_url}/Search/?q={mpn}"
+
+    print(f"🔍 Searching Radwell for: {mpn}")
+
+    browser, own_browser = await get_or_create_browser(browser)
+    results = []
+
+    try:
+        # ---------------------------
+        # LOAD SEARCH PAGE
+        # ---------------------------
+        soup, page, page_url = await load_search(
+            "Radwell", search_url, browser, RADWELL_SEARCH_VALID, RADWELL_SEARCH_VALID,
+            timeout=10, require_loaded=True, required=False,
+        )
+
+        # ---------------------------
+        # CASE 1: DIRECT PRODUCT PAGE
+        # ---------------------------
+        if soup.find("div", class_="rd-buyOpts"):
+            return await parse_radwell_product_page(soup, mpn, page_url)
+
+        # ---------------------------
+        # CASE 2: SEARCH RESULTS LIST
+        # ---------------------------
+        results_div = soup.find(id="searchResults")
+
+        if not results_div and page is not None:
+            # Retry once
+            await page.reload()
+            await wait_ready(
+                page, "div.rd-buyOpts, #searchResults", timeout=wait_per_try, require_loaded=True, required=False
+            )
+            await report_challenge("Radwell", page)
+            soup = await get_soup(page, scope="Radwell search")
+            results_div = soup.find(id="searchResults")
+
+        if not results_div:
+            return []  # the results never rendered; don't report it as not carried
+
+        # Find item tiles
+        items = results_div.find_all("a", class_="taglink")
+
+        if not items and page is not None:
+            await wait_ready(page, predicate=RADWELL_ANSWERED_JS, timeout=wait_per_try, required=False)
+            soup = await get_soup(page, scope="Radwell search")
+            results_div = soup.find(id="searchResults") or results_div
+            items = results_div.find_all("a", class_="taglink")
+
+        if not items:
+            if not RADWELL_NO_RESULTS.search(results_div.get_text(" ", strip=True)):
+                return []  # no tiles and no "no results" text: not an answer
+            # Radwell's own "no results" answer
+            return [
+                ProviderResult(
+                    supplier="Radwell",
+                    part_number=mpn,
+                    manufacturer="N/A",
+                    stock=0,
+                    price=0.0,
+                    url="Not Found",
+                    exact_match=False,
+                    not_carried=True
+                )
+            ]
+
+        # ---------------------------
+        # FIND EXACT MATCH IN SEARCH RESULTS
+        # ---------------------------
+        matcher = matcher_for(mpn)
+        for item in items:
+            title_tag = item.find("div", class_="partno")
+            title = title_tag.get("title", "").strip()
+            scraped_sku = title.lower()
+
+            if not matcher.exact(scraped_sku):
+                continue
+
+            link_tag = item.attrs.get("href")
+            if not link_tag:
+                continue
+            if not link_tag.startswith("http"):
+                product_url = "https://www.radwell.com" + link_tag
+            product_url = base_url + link_tag
+
+            # Go to product page
+            return await load_product(
+                "Radwell", product_url, browser, RADWELL_PRODUCT_VALID, "div.rd-buyOpts, div.option",
+                lambda fields: radwell_results_from_fields(fields, scraped_sku, product_url),
+                lambda soup: parse_radwell_product_page(soup, scraped_sku, product_url),
+                timeout=10, require_loaded=True, required=False,
+            )
+
+        # No exact match found
+        return [
+            ProviderResult(
+                supplier="Radwell",
+                part_number=mpn,
+                manufacturer="N/A",
+                stock=0,
+                price=0.0,
+                url=search_url,
+                exact_match=False
+            )
+        ]
+
+    except Exception as e:
+        print(f"[ERROR] Radwell exception for {mpn}: {e}")
+        traceback.print_exc()
+        return []
+
+    finally:
+        if own_browser:
+            browser.stop()
+
+async def parse_radwell_product_page(soup, mpn, url):
+    buy_opts = soup.find_all("div", class_="option")
+
+    if not buy_opts:
+        return [
+            ProviderResult(
+                supplier="Radwell",
+                part_number=mpn,
+                manufacturer=None,
+                stock=0,
+                price=0.0,
+                url=url,
+                exact_match=True
+            )
+        ]
+
+    new_option = None
+    for opt in buy_opts:
+        if opt.get("data-id") == "FNFP":  # NEW PRODUCT
+            new_option = opt
+            break
+
+    if not new_option:
+        # No new product option found
+        return [
+            ProviderResult(
+                supplier="Radwell",
+                part_number=mpn,
+                manufacturer=None,
+                stock=0,
+                price=0.0,
+                url=url,
+                exact_match=True
+            )
+        ]
+    # Manufacturer Part Number is same as MPN for Radwell listings
+    manufacturer_partnumber = soup.find("span", class_="pdp-part-number")
+    
+    # Stock
+    stock_el = new_option.find("div", class_="option__stock__v2")
+    stock_text = stock_el.get_text(strip=True) if stock_el else ""
+    stock = 0 if "call" in stock_text.lower() else parse_int(stock_text)
+
+    # Price
+    price_el = new_option.find("span", class_="ActualPrice")
+    price = parse_price(price_el.text if price_el else "")
+    manufacturer = None
+    # manufacturer-container
+    brand_el = soup.find("div", class_="manufacturer-container")
+    if brand_el:
+        manufacturer = brand_el.get_text(strip=True)
+    else:
+        manufacturer = None
+
+    return [
+        ProviderResult(
+            supplier="Radwell",
+            part_number=mpn,
+            manufacturer=manufacturer,
+            stock=stock,
+            price=price,
+            url=url,
+            exact_match=True,
+            scraped_sku=manufacturer_partnumber.text.strip() if manufacturer_partnumber else None
+        )
+    ]
+
+
+def radwell_results_from_fields(fields, mpn, url) -> List[ProviderResult]:
+    """parse_radwell_product_page on top of the "Radwell" extraction spec."""
+    page = fields["page"]
+    new_options = fields["blocks"]  # only the FNFP (new product) option
+    if not page["options"] or not new_options:
+        return [
+            ProviderResult(
+                supplier="Radwell",
+                part_number=mpn,
+                manufacturer=None,
+                stock=0,
+                price=0.0,
+                url=url,
+                exact_match=True
+            )
+        ]
+
+    new_option = new_options[0]
+    stock_text = new_option["stock"] or ""
+    stock = 0 if "call" in stock_text.lower() else parse_int(stock_text)
+
+    return [
+        ProviderResult(
+            supplier="Radwell",
+            part_number=mpn,
+            manufacturer=page["manufacturer"],
+            stock=stock,
+            price=parse_price(new_option["price"] or ""),
+            url=url,
+            exact_match=True,
+            scraped_sku=page["scraped_sku"].strip() if page["scraped_sku"] is not None else None
+        )
+    ]
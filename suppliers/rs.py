@@ -0,0 +1,214 @@
+import asyncio
+import json
+from typing import List, Optional
+
+import requests
+from nodriver import cdp
+
+from deadline import http_timeout
+from matching import matcher_for
+from models import ProviderResult
+from rate_limit import rate_limited, report_blocked
+from rs_session import RS_SEARCH_ENDPOINT, RSChallenge, get_rs_http, get_rs_session_manager, is_challenge
+from suppliers.common import parse_int, parse_price
+
+
+# ────────────────────────────────
+# RS Online Scraper (search endpoint with a shared DataDome session)
+# ────────────────────────────────
+def _match_rs_records(products: list, mpn: str) -> Optional[ProviderResult]:
+    """First record whose manufacturer_part_number contains the MPN, as a ProviderResult."""
+    matcher = matcher_for(mpn)
+    for prod in products:
+        allMeta = prod.get('allMeta', {})
+        attributes = allMeta.get('attributes', {})
+        attr_mpn_list = attributes.get('manufacturer_part_number', {}).get('text', [])
+        attr_mpn = attr_mpn_list[0] if attr_mpn_list else ''
+
+        # Skip if MPN doesn't match in title or attributes
+        if not matcher.substrings(attr_mpn):
+            continue
+
+        price_info = allMeta.get('priceInfo', {})
+        stock = attributes.get('available_qty', {}).get('numbers', [0])[0]
+
+        return ProviderResult(
+            supplier="RS Electric",
+            part_number=mpn,
+            manufacturer=", ".join(allMeta.get('brands', [])) or 'N/A',
+            stock=int(stock),
+            price=float(price_info.get('price', 0.0)),
+            url=allMeta.get('uri', f'https://us.rs-online.com/catalogsearch/result/?q={mpn}'),
+            exact_match=True
+        )
+    return None
+
+
+async def _fetch_rs_page(http, cookies: dict, mpn: str, page_num: int, page_size: int):
+    """One page of the groupby search endpoint: (records, cookies the site rotated)."""
+    params = {
+        'page': str(page_num),
+        'page_size': str(page_size),
+        'query': mpn,
+        'in_stock': '0',
+    }
+    referer = {'referer': f'https://us.rs-online.com/catalogsearch/result/?q={mpn}&page={page_num}'}
+
+    async with http.get(
+        RS_SEARCH_ENDPOINT, params=params, headers=referer, cookies=cookies, timeout=http_timeout(20)
+    ) as resp:
+        text = await resp.text()
+        if is_challenge(resp.status, text):
+            raise RSChallenge(f"HTTP {resp.status} / DataDome")
+        if resp.status == 429:
+            report_blocked("HTTP 429")
+        resp.raise_for_status()
+        rotated = {name: morsel.value for name, morsel in resp.cookies.items()}
+        return json.loads(text).get('records', []), rotated
+
+
+async def _search_rs(
+    http, cookies: dict, mpn: str, page_size: int, max_pages: int, concurrent_pages: bool
+):
+    """
+    Walk the result pages until one holds the MPN; returns (results, rotated cookies, no_hits).
+
+    `no_hits` is True only when RS returned no records at all for the query,
+    its own "no results" answer (records that just don't match are not).
+
+    With `concurrent_pages` all pages are requested at once, but they are
+    still consumed in page order, so the answer is the same as the sequential
+    walk: on a match at page k, pages after k are cancelled and pages before
+    k have already been checked.
+    """
+    rotated = {}
+    if not concurrent_pages:
+        for page_num in range(1, max_pages + 1):
+            products, new_cookies = await _fetch_rs_page(http, cookies, mpn, page_num, page_size)
+            rotated.update(new_cookies)
+            match = _match_rs_records(products, mpn)
+            if match:
+                return [match], rotated, False
+            if len(products) < page_size:
+                return [], rotated, page_num == 1 and not products
+        return [], rotated, False
+
+    tasks = [
+        asyncio.create_task(_fetch_rs_page(http, cookies, mpn, page_num, page_size))
+        for page_num in range(1, max_pages + 1)
+    ]
+    try:
+        for page_num, task in enumerate(tasks, 1):
+            products, new_cookies = await task
+            rotated.update(new_cookies)
+            match = _match_rs_records(products, mpn)
+            if match:
+                return [match], rotated, False
+            if len(products) < page_size:
+                return [], rotated, page_num == 1 and not products
+        return [], rotated, False
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@rate_limited("RS Online")
+async def scrape_rs(
+    mpn: str, browser, page_size: int = 20, max_pages: int = 3, concurrent_pages: bool = False
+) -> List[ProviderResult]:
+    rs = get_rs_session_manager()
+    http = get_rs_http()
+
+    try:
+        # Shared DataDome cookies; on a challenge refresh them once and retry
+        for attempt in (1, 2):
+            cookies = await rs.get_cookies(browser)
+            used_created_at = rs.created_at
+            try:
+                results, rotated, no_hits = await _search_rs(
+                    http, cookies, mpn, page_size, max_pages, concurrent_pages
+                )
+                rs.absorb(rotated)
+                break
+            except RSChallenge as e:
+                if attempt == 2:
+                    report_blocked(str(e))
+                    raise
+                print(f"[RS] {e} for {mpn}, refreshing session")
+                await rs.refresh(browser, used_created_at)
+
+        if not results:
+            results.append(
+                ProviderResult(
+                    supplier="RS Electric",
+                    part_number=mpn,
+                    manufacturer="N/A",
+                    stock=0,
+                    price=0.0,
+                    url=f'https://us.rs-online.com/catalogsearch/result/?q={mpn}',
+                    exact_match=False,
+                    not_carried=no_hits
+                )
+            )
+
+        return results
+
+    except Exception as e:
+        print(f"[ERROR] RS scraper exception for {mpn}: {e}")
+        return []
+
+
+async def parse_rs_product_page(soup, mpn, url):
+    # Stock
+    stock_el = soup.find(class_="stock available")
+    stock = parse_int(stock_el.text if stock_el else "")
+
+    # Price
+    price_el = soup.select_one(".price-box.price-final_price")
+    price = parse_price(price_el.text if price_el else "")
+    
+    manufacturer = None
+    # data-th="Brand"
+    brand = soup.find("td", attrs={"data-th": "Brand"})
+    if brand:
+        manufacturer = brand.text.strip()
+    else:
+        manufacturer = None
+    
+    return [
+        ProviderResult(
+            supplier="RS Electric",
+            part_number=mpn,
+            manufacturer=None,
+            stock=stock,
+            price=price,
+            url=url,
+            exact_match=True
+        )
+    ]
+
+
+# -----------------------------
+# Legacy: requests.Session from a browser page
+# -----------------------------
+async def get_rs_session(page) -> requests.Session:
+    """
+    Extract cookies and user-agent from the browser page and return a configured requests.Session.
+    """
+    raw_cookies = await page.send(cdp.storage.get_cookies())
+    session = requests.Session()
+    for c in raw_cookies:
+        session.cookies.set(
+            c.name,
+            c.value
+        )
+
+    ua = await page.evaluate("navigator.userAgent")
+    session.headers.update({
+        "User-Agent": ua,
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Referer": "https://us.rs-online.com/",
+    })
+    return session
@@ -0,0 +1,203 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+
+DEFAULT_POOL_SIZE = int(os.getenv("RSP_TAB_POOL_SIZE", "6"))
+HEALTH_CHECK_TIMEOUT = 5.0
+
+
+# ────────────────────────────────
+# Tab Pool
+# ────────────────────────────────
+class TabPool:
+    """
+    Fixed-size pool of nodriver tabs on one Chrome process.
+
+    Scrapers borrow a tab with `checkout(supplier)` (or `async with pool.tab(supplier)`)
+    and give it back with `checkin`. Idle tabs remember the supplier that used them
+    last, so a Digi-Key lookup gets the tab that is already sitting on digikey.com
+    and the next navigation reuses its warm connections and page state. When no tab
+    for that supplier is idle the least recently used tab of another supplier is
+    taken, and a new tab is only opened while the pool is below `size`.
+
+    Every reused tab is health checked before it is handed out; dead tabs are
+    dropped and replaced.
+    """
+
+    def __init__(self, browser, size: int = DEFAULT_POOL_SIZE, health_timeout: float = HEALTH_CHECK_TIMEOUT):
+        self.browser = browser
+        self.size = max(1, size)
+        self.health_timeout = health_timeout
+
+        self._cond = asyncio.Condition()
+        self._idle: Dict[Optional[str], List] = {}
+        self._idle_order: List = []  # all idle tabs, least recently used first
+        self._affinity: Dict[int, Optional[str]] = {}
+        self._open = 0  # tabs created or being created
+        self._closed = False
+
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    # ---------------------------
+    # Checkout / checkin
+    # ---------------------------
+    async def checkout(self, supplier: Optional[str] = None):
+        """Borrow a healthy tab, preferring one last used for `supplier`."""
+        while True:
+            tab = None
+            async with self._cond:
+                while True:
+                    tab = self._take_idle(supplier)
+                    if tab is not None:
+                        break
+                    if self._closed:
+                        raise RuntimeError("TabPool is closed")
+                    if self._open < self.size:
+                        self._open += 1  # reserve the slot before leaving the lock
+                        break
+                    await self._cond.wait()
+
+            if tab is None:
+                try:
+                    tab = await self.browser.get("about:blank", new_tab=True)
+                except BaseException:
+                    async with self._cond:
+                        self._open -= 1
+                        self._cond.notify()
+                    raise
+                self.created += 1
+                return await self._prepare(tab, supplier)
+
+            if await self.is_healthy(tab):
+                self.reused += 1
+                return await self._prepare(tab, supplier)
+
+            print(f"[TabPool] Dropping unhealthy tab (last used by {self._affinity.get(id(tab))})")
+            await self._discard(tab)
+
+    async def checkin(self, tab, supplier: Optional[str] = None, healthy: bool = True):
+        """Return a borrowed tab; unhealthy tabs are closed instead of pooled."""
+        if not healthy or self._closed:
+            await self._discard(tab)
+            return
+
+        async with self._cond:
+            self._affinity[id(tab)] = supplier
+            self._idle.setdefault(supplier, []).append(tab)
+            self._idle_order.append(tab)
+            self._cond.notify()
+
+    @asynccontextmanager
+    async def tab(self, supplier: Optional[str] = None):
+        """`async with pool.tab("Digi-Key") as tab:` — checkout and guaranteed checkin."""
+        tab = await self.checkout(supplier)
+        try:
+            yield tab
+        finally:
+            await self.checkin(tab, supplier)
+
+    # ---------------------------
+    # Health
+    # ---------------------------
+    async def is_healthy(self, tab) -> bool:
+        """A tab is healthy when its websocket is open and it still evaluates JS."""
+        try:
+            if getattr(tab, "closed", False):
+                return False
+            value = await asyncio.wait_for(
+                tab.evaluate("1 + 1", return_by_value=True), timeout=self.health_timeout
+            )
+            return value == 2
+        except Exception:
+            return False
+
+    async def close(self):
+        """Close every idle tab; borrowed tabs are closed when they come back."""
+        async with self._cond:
+            tabs = list(self._idle_order)
+            self._idle.clear()
+            self._idle_order.clear()
+            self._closed = True
+        for tab in tabs:
+            await self._close_tab(tab)
+
+    def has_free(self) -> bool:
+        """True when a checkout would not have to wait for another lookup to finish."""
+        return bool(self._idle_order) or self._open < self.size
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "open": self._open,
+            "idle": len(self._idle_order),
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+        }
+
+    # ---------------------------
+    # Internals
+    # ---------------------------
+    def _take_idle(self, supplier):
+        tabs = self._idle.get(supplier)
+        if tabs:
+            tab = tabs.pop()
+        elif self._idle_order:
+            tab = self._idle_order[0]
+            self._idle[self._affinity.get(id(tab))].remove(tab)
+        else:
+            return None
+        self._idle_order.remove(tab)
+        return tab
+
+    @staticmethod
+    async def _prepare(tab, supplier):
+        """Point the tab's resource filter at the supplier about to use it."""
+        from resources import get_resource_filter
+
+        resource_filter = get_resource_filter()
+        if resource_filter is not None:
+            try:
+                await resource_filter.attach(tab, supplier)
+            except Exception as e:
+                print(f"[TabPool] Could not install the resource filter: {e}")
+        return tab
+
+    async def _discard(self, tab):
+        self.discarded += 1
+        async with self._cond:
+            self._affinity.pop(id(tab), None)
+            self._open -= 1
+            self._cond.notify()
+        await self._close_tab(tab)
+
+    @staticmethod
+    async def _close_tab(tab):
+        from resources import get_resource_filter
+
+        resource_filter = get_resource_filter()
+        if resource_filter is not None:
+            resource_filter.detach(tab)
+        try:
+            await tab.close()
+        except Exception:
+            pass
+
+
+# ────────────────────────────────
+# Shared pool per browser
+# ────────────────────────────────
+_POOLS: Dict[int, TabPool] = {}
+
+
+def get_tab_pool(browser, size: int = DEFAULT_POOL_SIZE) -> TabPool:
+    """Return the pool bound to `browser`, creating it on first use."""
+    pool = _POOLS.get(id(browser))
+    if pool is None or pool.browser is not browser:
+        pool = TabPool(browser, size=size)
+        _POOLS[id(browser)] = pool
+    return pool
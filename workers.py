@@ -0,0 +1,183 @@
+import asyncio
+import multiprocessing as mp
+import os
+import queue
+import threading
+from typing import AsyncIterator, Dict, List, Set, Tuple
+
+import startup
+from prewarm import prewarm
+from registry import LazyBrowser, close_clients, enable_batching, needs_browser, stop_browser
+from search import finish_refreshes, run_concurrent
+
+
+PROFILE_ROOT = "/tmp/chrome_profile"
+
+# Events sent from the workers to the orchestrator:
+#   ("ready",     worker_id, pid)
+#   ("row_start", worker_id, row)
+#   ("outcome",   worker_id, row, supplier, [ProviderResult, ...], error or None, timed_out)
+#   ("row_done",  worker_id, row)
+#   ("exit",      worker_id, error or None)
+# run_sharded passes everything but "row_start" and "exit" on, and adds
+#   ("row_failed", worker_id, row, reason)
+# for each row a worker had in flight when it crashed or died.
+WorkerEvent = Tuple
+
+
+# ────────────────────────────────
+# Worker process
+# ────────────────────────────────
+def _worker_entry(worker_id: int, suppliers: List[str], concurrency: int, use_cache: bool, tasks, events):
+    """Process entry point; each worker owns one event loop and one Chrome."""
+    error = None
+    try:
+        asyncio.run(_worker(worker_id, suppliers, concurrency, use_cache, tasks, events))
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        print(f"[ERROR] Worker {worker_id} crashed: {error}")
+    finally:
+        events.put(("exit", worker_id, error))
+
+
+async def _worker(worker_id: int, suppliers: List[str], concurrency: int, use_cache: bool, tasks, events):
+    from chrome import get_or_create_browser
+
+    enable_batching(suppliers)  # e.g. eBay rows in flight share OR searches
+
+    async def _launch():
+        # Chrome locks its profile directory, so every worker gets its own
+        browser, _ = await get_or_create_browser(user_data_dir=f"{PROFILE_ROOT}_w{worker_id}")
+        return browser
+
+    browser = LazyBrowser(_launch) if needs_browser(suppliers) else None
+
+    startup.mark("ready")
+    startup.report(f"[Startup] Worker {worker_id}")
+    events.put(("ready", worker_id, os.getpid()))
+
+    stopping = threading.Event()
+
+    def _take():
+        # Polls, so no thread is left blocked on the shared queue after teardown.
+        # "row_start" is sent from here: a row taken while the worker goes down
+        # still reaches the orchestrator, which reports it as "row_failed".
+        while not stopping.is_set():
+            try:
+                row = tasks.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if row is not None:
+                events.put(("row_start", worker_id, row["row"]))
+            return row
+        return None
+
+    async def _consume():
+        while not stopping.is_set():
+            row = await asyncio.to_thread(_take)
+            if row is None:
+                return
+
+            def on_done(outcome, row=row["row"]):
+                error = str(outcome.error) if outcome.error else None
+                events.put(("outcome", worker_id, row, outcome.name, outcome.results, error, outcome.timed_out))
+
+            await run_concurrent(
+                row["mpn"], row["manufacturer"], suppliers, browser,
+                on_done=on_done, use_cache=use_cache, stale_while_revalidate=False,
+            )
+            events.put(("row_done", worker_id, row["row"]))
+
+    def on_progress(name, state, seconds):
+        if state != "warming":
+            print(f"[Prewarm] Worker {worker_id} {name}: {state} ({seconds:.1f}s)")
+
+    try:
+        # eBay token and RS session before the first row; the supplier origins are
+        # visited once a row has started this worker's Chrome
+        await prewarm(suppliers, browser, on_progress=on_progress)
+        await asyncio.gather(*(_consume() for _ in range(max(1, concurrency))))
+    finally:
+        stopping.set()
+        await finish_refreshes()
+        await close_clients()
+        stop_browser(browser)
+
+
+# ────────────────────────────────
+# Orchestrator
+# ────────────────────────────────
+async def run_sharded(
+    rows: List[dict],
+    suppliers: List[str],
+    workers: int = 2,
+    concurrency: int = 2,
+    use_cache: bool = True,
+) -> AsyncIterator[WorkerEvent]:
+    """
+    Spread `rows` over `workers` processes and stream their events back.
+
+    Rows go through one shared task queue, so a worker that finishes early
+    simply pulls the next row. Each worker keeps `concurrency` rows in flight
+    on its own browser. "outcome" events arrive as soon as a supplier finishes
+    in any worker; "row_done" follows once every supplier of that row is in.
+    Rows a worker had in flight when it crashed or died come back as
+    "row_failed", so they are never silently missing from the output.
+    """
+    ctx = mp.get_context("spawn")
+    tasks = ctx.Queue()
+    events = ctx.Queue()
+
+    for row in rows:
+        tasks.put(row)
+    for _ in range(workers * max(1, concurrency)):
+        tasks.put(None)  # one stop marker per consumer
+
+    procs = [
+        ctx.Process(
+            target=_worker_entry,
+            args=(worker_id, suppliers, concurrency, use_cache, tasks, events),
+            daemon=True,
+        )
+        for worker_id in range(workers)
+    ]
+    for p in procs:
+        p.start()
+
+    exited = set()
+    in_flight: Dict[int, Set[int]] = {worker_id: set() for worker_id in range(workers)}
+    try:
+        while len(exited) < len(procs):
+            try:
+                event = await asyncio.to_thread(events.get, True, 1.0)
+            except queue.Empty:
+                for worker_id, p in enumerate(procs):
+                    if worker_id not in exited and not p.is_alive() and events.empty():
+                        print(f"[Workers] Worker {worker_id} died (exit code {p.exitcode})")
+                        exited.add(worker_id)
+                        for row in sorted(in_flight[worker_id]):
+                            yield ("row_failed", worker_id, row, f"worker died (exit code {p.exitcode})")
+                        in_flight[worker_id].clear()
+                continue
+
+            kind, worker_id = event[0], event[1]
+            if kind == "row_start":
+                in_flight[worker_id].add(event[2])
+                continue
+            if kind == "row_done":
+                in_flight[worker_id].discard(event[2])
+            if kind == "exit":
+                exited.add(worker_id)
+                if event[2]:
+                    print(f"[Workers] Worker {worker_id} stopped with error: {event[2]}")
+                for row in sorted(in_flight[worker_id]):
+                    yield ("row_failed", worker_id, row, f"worker stopped: {event[2] or 'no error'}")
+                in_flight[worker_id].clear()
+                continue
+
+            yield event
+    finally:
+        for p in procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()